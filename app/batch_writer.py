@@ -0,0 +1,93 @@
+"""Append-only file writer that submits lines in batches."""
+
+import os
+import weakref
+from typing import List
+
+
+def _write_all(fd: int, pending: List[bytes]):
+    """Write all queued data in a single call and sync it to disk once."""
+    if not pending:
+        return
+    
+    # writev submits every queued buffer in one syscall without joining
+    # them; platforms without it, and short writes, fall back to os.write
+    written = os.writev(fd, pending) if hasattr(os, 'writev') else 0
+    if written < sum(len(data) for data in pending):
+        remaining = b''.join(pending)[written:]
+        while remaining:
+            remaining = remaining[os.write(fd, remaining):]
+    
+    os.fsync(fd)
+    pending.clear()
+
+
+def _close(fd: int, pending: List[bytes]):
+    """Write any queued data and close the descriptor."""
+    try:
+        _write_all(fd, pending)
+    finally:
+        os.close(fd)
+
+
+class BatchWriter:
+    """Appends encoded lines to a file with one write and one fsync per batch."""
+    
+    def __init__(self, filepath: str, batch_size: int = 4):
+        """
+        Open the file for appending.
+        
+        Args:
+            filepath: Path of the file to append to
+            batch_size: Number of queued lines that triggers a write
+        """
+        self.filepath = filepath
+        self.batch_size = batch_size
+        self._pending: List[bytes] = []
+        self._fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        
+        # The finalizer holds the descriptor and queue rather than the writer,
+        # so a writer dropped without close() still flushes and releases them
+        self._finalizer = weakref.finalize(self, _close, self._fd, self._pending)
+    
+    @property
+    def closed(self) -> bool:
+        """Check if the writer has been closed."""
+        return self._fd is None
+    
+    def write(self, data: bytes):
+        """
+        Queue data and write the batch once it is full.
+        
+        Args:
+            data: Bytes to append
+        """
+        self._check_open()
+        self._pending.append(data)
+        if len(self._pending) >= self.batch_size:
+            self.drain()
+    
+    def drain(self):
+        """Write all queued data in a single call and sync it to disk once."""
+        self._check_open()
+        _write_all(self._fd, self._pending)
+    
+    def truncate(self):
+        """Discard queued data and empty the file."""
+        self._check_open()
+        self._pending.clear()
+        os.ftruncate(self._fd, 0)
+    
+    def _check_open(self):
+        """Raise ValueError if the writer has been closed."""
+        if self._fd is None:
+            raise ValueError("writer is closed")
+    
+    def close(self):
+        """Write any queued data and close the file."""
+        if self.closed:
+            return
+        try:
+            self._finalizer()
+        finally:
+            self._fd = None
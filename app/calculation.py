@@ -1,27 +1,24 @@
 """Calculation class to represent a single calculation."""
 
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
 
 
+@dataclass(frozen=True, slots=True)
 class Calculation:
     """Represents a single calculation with operation, operands, and result."""
     
-    def __init__(self, operation: str, operand1: float, operand2: float, result: float):
-        """
-        Initialize a calculation.
-        
-        Args:
-            operation: Name of the operation (e.g., 'add', 'subtract')
-            operand1: First operand
-            operand2: Second operand
-            result: Result of the calculation
-        """
-        self.operation = operation
-        self.operand1 = operand1
-        self.operand2 = operand2
-        self.result = result
-        self.timestamp = datetime.now()
+    operation: str
+    operand1: float
+    operand2: float
+    result: float
+    epoch: float = field(default_factory=time.time)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Local time of the calculation, built from the stored epoch seconds."""
+        return datetime.fromtimestamp(self.epoch)
     
     def __repr__(self) -> str:
         """String representation of the calculation."""
@@ -43,15 +40,41 @@ class Calculation:
             'timestamp': self.timestamp.isoformat()
         }
     
+    @classmethod
+    def _unsafe_new(cls, operation: str, operand1: float, operand2: float,
+                    result: float, epoch: float) -> 'Calculation':
+        """
+        Build a calculation from trusted, already-typed values.
+        
+        Writes the slots directly, skipping the dataclass __init__ and the
+        frozen __setattr__ checks. Meant for bulk loading.
+        """
+        calc = object.__new__(cls)
+        _set_operation(calc, operation)
+        _set_operand1(calc, operand1)
+        _set_operand2(calc, operand2)
+        _set_result(calc, result)
+        _set_epoch(calc, epoch)
+        return calc
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'Calculation':
         """Create a Calculation from a dictionary."""
-        calc = cls(
+        if 'timestamp' in data:
+            epoch = datetime.fromisoformat(data['timestamp']).timestamp()
+        else:
+            epoch = time.time()
+        return cls(
             operation=data['operation'],
             operand1=float(data['operand1']),
             operand2=float(data['operand2']),
-            result=float(data['result'])
+            result=float(data['result']),
+            epoch=epoch
         )
-        if 'timestamp' in data:
-            calc.timestamp = datetime.fromisoformat(data['timestamp'])
-        return calc
+
+
+# Slot descriptor setters, bound once for Calculation._unsafe_new
+(_set_operation, _set_operand1, _set_operand2, _set_result, _set_epoch) = (
+    Calculation.__dict__[name].__set__
+    for name in ('operation', 'operand1', 'operand2', 'result', 'epoch')
+)
@@ -1,17 +1,104 @@
 """Main calculator class with Observer pattern implementation."""
 
-from typing import List, Protocol
+import atexit
+import functools
+import logging
+import operator
+import sys
+import time
+import weakref
+from typing import Callable, Dict, FrozenSet, List, Optional, Protocol, Tuple
 from pathlib import Path
+from app.batch_writer import BatchWriter
 from app.calculation import Calculation
-from app.operations import OperationFactory
+from app.operations import OperationFactory, execute_vectorized
 from app.history import CalculationHistory
 from app.logger import Logger
 from app.calculator_config import CalculatorConfig
 from app.exceptions import OperationError
 
 
+def _round_result(execute: Callable[[float, float], float], precision: int) -> Callable[[float, float], float]:
+    """Wrap an operation so its result is rounded to a fixed precision."""
+    def calculate(a: float, b: float) -> float:
+        return round(execute(a, b), precision)
+    return calculate
+
+
+# Operations without validation map straight to C-implemented callables,
+# skipping a Python-level execute() frame per calculation
+_NATIVE_KERNELS: Dict[str, Callable[[float, float], float]] = {
+    'add': operator.add,
+    'subtract': operator.sub,
+    'multiply': operator.mul,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _build_op_table(precision: int) -> Dict[str, Callable[[float, float], float]]:
+    """
+    Build the operation table with precision bound into each entry.
+    
+    Operations are stateless, so calculators that share a precision also
+    share one table.
+    """
+    return {
+        name: _round_result(
+            _NATIVE_KERNELS.get(name) or OperationFactory.create_operation(name).execute,
+            precision
+        )
+        for name in OperationFactory.get_available_operations()
+    }
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _compute(operation: str, a: float, b: float, precision: int) -> float:
+    """
+    Compute a rounded operation result, memoizing repeated inputs.
+    
+    Operations are pure, so results are safe to reuse; failures are not
+    cached and raise again on every call. Keys are typed so int and float
+    operands keep their own result types, but 0.0 and -0.0 share a key, so
+    callers bypass the cache via _compute.__wrapped__ for zero operands.
+    
+    Args:
+        operation: Name of the operation to perform
+        a: First operand
+        b: Second operand
+        precision: Number of decimal places to round to
+    
+    Returns:
+        Rounded result
+    
+    Raises:
+        OperationError: If the operation is unknown or fails
+    """
+    op_table = _build_op_table(precision)
+    execute = op_table.get(operation) or op_table.get(operation.lower())
+    if execute is None:
+        raise OperationError(f"Unknown operation: {operation}")
+    return execute(a, b)
+
+
+# Auto-save observers still open at interpreter exit; held weakly so an
+# unused observer is collected with its history instead of living until exit
+_open_auto_save_observers: "weakref.WeakSet[AutoSaveObserver]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_auto_save_observers():
+    """Drain every auto-save observer that was never explicitly closed."""
+    for observer in list(_open_auto_save_observers):
+        observer.close()
+
+
 class CalculatorObserver(Protocol):
-    """Protocol for calculator observers."""
+    """
+    Protocol for calculator observers.
+    
+    Observers may also define update_batch(calculations) to receive bulk
+    calculations in one call; otherwise update is called for each one.
+    """
     
     def update(self, calculation: Calculation):
         """Called when a new calculation is performed."""
@@ -27,37 +114,133 @@ class LoggingObserver:
     
     def update(self, calculation: Calculation):
         """Log the calculation."""
-        self.logger.info(
-            f"Calculation performed: {calculation.operation} | "
-            f"Operands: {calculation.operand1}, {calculation.operand2} | "
-            f"Result: {calculation.result}"
-        )
+        # Skip building the message when INFO records would be dropped anyway
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                f"Calculation performed: {calculation.operation} | "
+                f"Operands: {calculation.operand1}, {calculation.operand2} | "
+                f"Result: {calculation.result}"
+            )
+    
+    def update_batch(self, calculations: List[Calculation]):
+        """Log a batch of calculations as a single record."""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                f"Batch calculation performed: {len(calculations)} calculations | "
+                f"Operations: {', '.join(sorted({c.operation for c in calculations}))}"
+            )
 
 
 class AutoSaveObserver:
-    """Observer that auto-saves history to CSV."""
+    """Observer that auto-saves history to CSV via an append-only log."""
     
-    def __init__(self, history: CalculationHistory, filepath: str):
+    def __init__(self, history: CalculationHistory, filepath: str, flush_interval: int = 10,
+                 max_delay: float = 1.0):
         """
         Initialize with history and filepath.
         
         Args:
             history: CalculationHistory instance
             filepath: Path to save CSV file
+            flush_interval: Number of calculations between full CSV snapshots
+            max_delay: Seconds after the last snapshot at which the next
+                calculation triggers one regardless of flush_interval
         """
         self.history = history
         self.filepath = filepath
+        self.flush_interval = flush_interval
+        self.max_delay = max_delay
+        self._pending = 0
+        self._last_flush = time.monotonic()
         
         # Ensure directory exists
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        
+        # Calculations since the last snapshot are appended here so each
+        # update queues one line instead of rewriting the whole CSV; any a
+        # previous run logged but never snapshotted are folded in first
+        self._recover()
+        self._wal = BatchWriter(f"{filepath}.wal")
+        
+        # Pending calculations still reach the CSV if the process exits
+        # without close() being called
+        _open_auto_save_observers.add(self)
+    
+    def _recover(self):
+        """Fold calculations left in the log by an unclean exit into the CSV."""
+        log = Path(f"{self.filepath}.wal")
+        if not log.exists() or not log.stat().st_size:
+            return
+        try:
+            recovered = CalculationHistory(max_size=self.history.max_size)
+            recovered.load_from_csv(self.filepath)
+            if len(recovered):
+                recovered.save_to_csv(self.filepath)
+            log.write_bytes(b'')
+        except Exception as e:
+            # Don't raise exception, just log it
+            print(f"Warning: Auto-save recovery failed: {str(e)}")
     
     def update(self, calculation: Calculation):
-        """Auto-save history when calculation is performed."""
+        """Log the calculation and snapshot history every flush_interval calls."""
+        if self._wal.closed:
+            return
         try:
-            self.history.save_to_csv(self.filepath)
+            line = (f"{calculation.operation},{calculation.operand1},"
+                    f"{calculation.operand2},{calculation.result},"
+                    f"{calculation.timestamp.isoformat()}\n")
+            self._wal.write(line.encode())
+            
+            self._pending += 1
+            if (self._pending >= self.flush_interval
+                    or time.monotonic() - self._last_flush >= self.max_delay):
+                self.flush()
+        except Exception as e:
+            # Don't raise exception, just log it
+            print(f"Warning: Auto-save failed: {str(e)}")
+    
+    def history_changed(self):
+        """Snapshot history after a clear, undo or redo the log cannot record."""
+        try:
+            self.flush()
+        except Exception as e:
+            # Don't raise exception, just log it
+            print(f"Warning: Auto-save failed: {str(e)}")
+    
+    def update_batch(self, calculations: List[Calculation]):
+        """Snapshot history once for a whole batch of calculations."""
+        try:
+            self.flush()
         except Exception as e:
             # Don't raise exception, just log it
             print(f"Warning: Auto-save failed: {str(e)}")
+    
+    def flush(self):
+        """Write a full CSV snapshot and truncate the append-only log."""
+        # A closed observer has already written its final snapshot
+        if self._wal.closed:
+            return
+        if len(self.history):
+            self.history.save_to_csv(self.filepath)
+        else:
+            # A cleared history leaves no snapshot for the log to extend
+            Path(self.filepath).unlink(missing_ok=True)
+        self._wal.truncate()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+    
+    def close(self):
+        """Drain the append-only log into a final snapshot and close it."""
+        if self._wal.closed:
+            return
+        _open_auto_save_observers.discard(self)
+        try:
+            if self._pending:
+                self.flush()
+        except Exception as e:
+            print(f"Warning: Auto-save failed: {str(e)}")
+        finally:
+            self._wal.close()
 
 
 class Calculator:
@@ -75,8 +258,21 @@ class Calculator:
             log_dir=self.config.log_dir,
             log_file="calculator.log"
         )
-        self.history = CalculationHistory(max_size=self.config.max_history_size)
+        self.history = CalculationHistory(
+            max_size=self.config.max_history_size,
+            max_undo_levels=self.config.max_undo_levels
+        )
         self._observers: List[CalculatorObserver] = []
+        self._observer_snapshot: Tuple[CalculatorObserver, ...] = ()
+        self._auto_save_observer: Optional[AutoSaveObserver] = None
+        
+        # Resolve operations once so calculate() is a single dict lookup
+        self._precision = self.config.precision
+        _build_op_table(self._precision)
+        self._op_names: Tuple[str, ...] = tuple(
+            sys.intern(name) for name in OperationFactory.get_available_operations()
+        )
+        self._op_set: FrozenSet[str] = frozenset(self._op_names)
         
         # Register observers
         self._setup_observers()
@@ -92,22 +288,41 @@ class Calculator:
         # Add auto-save observer if enabled
         if self.config.auto_save:
             history_file = Path(self.config.history_dir) / "calculator_history.csv"
-            auto_save_observer = AutoSaveObserver(self.history, str(history_file))
-            self.add_observer(auto_save_observer)
+            self._auto_save_observer = AutoSaveObserver(
+                self.history,
+                str(history_file),
+                flush_interval=self.config.auto_save_flush_interval
+            )
+            self.add_observer(self._auto_save_observer)
     
     def add_observer(self, observer: CalculatorObserver):
         """Add an observer to be notified of calculations."""
         self._observers.append(observer)
+        self._observer_snapshot = tuple(self._observers)
     
     def remove_observer(self, observer: CalculatorObserver):
         """Remove an observer."""
         self._observers.remove(observer)
+        self._observer_snapshot = tuple(self._observers)
     
     def _notify_observers(self, calculation: Calculation):
         """Notify all observers of a new calculation."""
-        for observer in self._observers:
+        observers = self._observer_snapshot
+        if not observers:
+            return
+        for observer in observers:
             observer.update(calculation)
     
+    def _notify_observers_batch(self, calculations: List[Calculation]):
+        """Notify all observers of a batch of calculations."""
+        for observer in self._observer_snapshot:
+            update_batch = getattr(observer, 'update_batch', None)
+            if update_batch is not None:
+                update_batch(calculations)
+            else:
+                for calculation in calculations:
+                    observer.update(calculation)
+    
     def calculate(self, operation: str, operand1: float, operand2: float) -> float:
         """
         Perform a calculation.
@@ -116,51 +331,116 @@ class Calculator:
             operation: Name of the operation to perform
             operand1: First operand
             operand2: Second operand
-            
+        
         Returns:
             Result of the calculation
-            
+        
         Raises:
             OperationError: If operation fails
         """
+        # A cached 0.0 result must not be returned for -0.0 or vice versa
+        compute = _compute.__wrapped__ if operand1 == 0 or operand2 == 0 else _compute
         try:
-            # Create operation instance
-            op = OperationFactory.create_operation(operation)
-            
-            # Execute operation
-            result = op.execute(operand1, operand2)
-            
-            # Round result based on precision
-            result = round(result, self.config.precision)
-            
-            # Create calculation record
-            calculation = Calculation(operation, operand1, operand2, result)
-            
-            # Add to history
-            self.history.add_calculation(calculation)
-            
-            # Notify observers
-            self._notify_observers(calculation)
-            
-            return result
+            result = compute(operation, operand1, operand2, self._precision)
+        except OperationError:
+            raise
+        except Exception as e:
+            raise OperationError(f"Calculation failed: {str(e)}")
+        
+        # Create calculation record
+        calculation = Calculation(operation, operand1, operand2, result)
+        
+        # Add to history
+        self.history.add_calculation(calculation)
+        
+        # Notify observers
+        self._notify_observers(calculation)
+        
+        return result
+    
+    def calculate_bulk(self, operation: str, operands1: List[float], operands2: List[float]) -> List[float]:
+        """
+        Perform one operation over pairs of operands as a single batch.
+        
+        All calculations are added to history as one undoable step and
+        observers are notified once. If any pair fails, nothing is recorded.
+        
+        Args:
+            operation: Name of the operation to perform
+            operands1: First operands
+            operands2: Second operands, same length as operands1
+        
+        Returns:
+            Results of the calculations, in order
+        
+        Raises:
+            OperationError: If operation fails for any pair
+        """
+        if len(operands1) != len(operands2):
+            raise OperationError("Operand lists must have the same length")
+        
+        results = self.calculate_many(operation, operands1, operands2).tolist()
+        if not results:
+            return results
+        
+        calculations = [
+            Calculation(operation, a, b, result)
+            for a, b, result in zip(operands1, operands2, results)
+        ]
+        self.history.add_calculations_bulk(calculations)
+        self._notify_observers_batch(calculations)
+        
+        return results
+    
+    def calculate_many(self, operation: str, operands1, operands2):
+        """
+        Compute an operation over arrays of operands without recording it.
+        
+        Results are rounded to the configured precision with NumPy, which can
+        differ from round() in the last digit for values exactly halfway.
+        
+        Args:
+            operation: Name of the operation to perform
+            operands1: First operands (array-like)
+            operands2: Second operands (array-like)
+        
+        Returns:
+            NumPy float64 array of rounded results
+        
+        Raises:
+            OperationError: If operation fails for any element
+        """
+        import numpy as np
+        
+        try:
+            return np.round(execute_vectorized(operation, operands1, operands2), self._precision)
         except OperationError:
             raise
         except Exception as e:
             raise OperationError(f"Calculation failed: {str(e)}")
     
+    def close(self):
+        """Flush pending auto-save data and release its file handle."""
+        if self._auto_save_observer is not None:
+            self._auto_save_observer.close()
+    
     def get_history(self) -> List[Calculation]:
         """Get calculation history."""
         return self.history.get_history()
     
     def clear_history(self):
         """Clear calculation history."""
+        changed = len(self.history) > 0
         self.history.clear_history()
+        if changed:
+            self._history_changed()
         self.logger.info("History cleared")
     
     def undo(self) -> bool:
         """Undo the last calculation."""
         success = self.history.undo()
         if success:
+            self._history_changed()
             self.logger.info("Undo performed")
         return success
     
@@ -168,9 +448,15 @@ class Calculator:
         """Redo the last undone calculation."""
         success = self.history.redo()
         if success:
+            self._history_changed()
             self.logger.info("Redo performed")
         return success
     
+    def _history_changed(self):
+        """Persist a history change that did not come from a calculation."""
+        if self._auto_save_observer is not None:
+            self._auto_save_observer.history_changed()
+    
     def save_history(self, filepath: str = None):
         """
         Manually save history to file.
@@ -197,6 +483,10 @@ class Calculator:
         self.history.load_from_csv(str(filepath))
         self.logger.info(f"History loaded from {filepath}")
     
-    def get_available_operations(self) -> List[str]:
-        """Get list of available operations."""
-        return OperationFactory.get_available_operations()
+    def get_available_operations(self) -> Tuple[str, ...]:
+        """Get the names of available operations."""
+        return self._op_names
+    
+    def is_available_operation(self, name: str) -> bool:
+        """Check whether name is an available operation."""
+        return name in self._op_set
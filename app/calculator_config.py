@@ -1,7 +1,6 @@
 """Configuration management using environment variables."""
 
 import os
-from pathlib import Path
 from dotenv import load_dotenv
 from app.exceptions import ConfigurationError
 
@@ -9,17 +8,26 @@ from app.exceptions import ConfigurationError
 class CalculatorConfig:
     """Manages calculator configuration from environment variables."""
     
+    # The .env file is read once per process, not once per instance
+    _dotenv_loaded = False
+    
     def __init__(self):
         """Load configuration from .env file."""
-        load_dotenv()
+        if not CalculatorConfig._dotenv_loaded:
+            # Skip the dotenv lookup entirely when there is no .env file
+            if os.path.exists('.env'):
+                load_dotenv('.env')
+            CalculatorConfig._dotenv_loaded = True
         
         # Base directories
         self.log_dir = os.getenv('CALCULATOR_LOG_DIR', 'logs')
         self.history_dir = os.getenv('CALCULATOR_HISTORY_DIR', 'history')
         
         # History settings
-        self.max_history_size = self._get_int('CALCULATOR_MAX_HISTORY_SIZE', 100)
+        self.max_history_size = self._get_non_negative_int('CALCULATOR_MAX_HISTORY_SIZE', 100)
         self.auto_save = self._get_bool('CALCULATOR_AUTO_SAVE', True)
+        self.auto_save_flush_interval = self._get_int('CALCULATOR_AUTO_SAVE_FLUSH_INTERVAL', 10)
+        self.max_undo_levels = self._get_non_negative_int('CALCULATOR_MAX_UNDO_LEVELS', 100)
         
         # Calculation settings
         self.precision = self._get_int('CALCULATOR_PRECISION', 2)
@@ -27,8 +35,15 @@ class CalculatorConfig:
         self.default_encoding = os.getenv('CALCULATOR_DEFAULT_ENCODING', 'utf-8')
         
         # Create directories if they don't exist
-        Path(self.log_dir).mkdir(parents=True, exist_ok=True)
-        Path(self.history_dir).mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.log_dir)
+        self._ensure_dir(self.history_dir)
+    
+    @staticmethod
+    def _ensure_dir(path: str):
+        """Create a directory if it does not exist."""
+        # Existing directories, the common case, cost a single stat
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
     
     def _get_int(self, key: str, default: int) -> int:
         """Get integer value from environment."""
@@ -40,6 +55,13 @@ class CalculatorConfig:
         except ValueError:
             raise ConfigurationError(f"Invalid integer value for {key}: {value}")
     
+    def _get_non_negative_int(self, key: str, default: int) -> int:
+        """Get integer value from environment that must not be negative."""
+        value = self._get_int(key, default)
+        if value < 0:
+            raise ConfigurationError(f"Invalid non-negative integer value for {key}: {value}")
+        return value
+    
     def _get_float(self, key: str, default: float) -> float:
         """Get float value from environment."""
         value = os.getenv(key)
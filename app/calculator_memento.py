@@ -1,83 +1,153 @@
-"""Memento pattern implementation for undo/redo functionality."""
+"""Memento and command implementations for undo/redo functionality."""
 
-from typing import List, Optional
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Iterable, List, Optional, Tuple, Union
 from app.calculation import Calculation
 
 
 class CalculatorMemento:
     """Stores the state of calculator history for undo/redo."""
     
-    def __init__(self, history: List[Calculation]):
+    def __init__(self, history: Iterable[Calculation]):
         """
         Initialize memento with history state.
         
         Args:
-            history: List of calculations to save
+            history: Calculations to save
         """
-        self._history = [calc for calc in history]  # Deep copy
+        # Calculations are frozen, so a shallow tuple is a complete snapshot
+        self._state: Tuple[Calculation, ...] = tuple(history)
+    
+    @property
+    def state(self) -> Tuple[Calculation, ...]:
+        """Return the saved history state without copying it."""
+        return self._state
     
     def get_state(self) -> List[Calculation]:
-        """Return the saved history state."""
-        return [calc for calc in self._history]  # Return copy
+        """Return a mutable copy of the saved history state."""
+        return list(self._state)
 
 
-class HistoryCaretaker:
-    """Manages memento states for undo/redo operations."""
+@dataclass
+class AddCalcCommand:
+    """Records a calculation appended to history, plus any entry it evicted."""
+    
+    calculation: Calculation
+    evicted: Optional[Calculation] = None
+    
+    def undo(self, history: Deque[Calculation]):
+        """Remove the calculation and restore the evicted entry, if any."""
+        history.pop()
+        if self.evicted is not None:
+            history.appendleft(self.evicted)
+    
+    def redo(self, history: Deque[Calculation]):
+        """Re-append the calculation; a full history evicts its oldest entry."""
+        history.append(self.calculation)
+
+
+@dataclass
+class AddBatchCommand:
+    """Records several calculations appended to history as one step."""
+    
+    calculations: Tuple[Calculation, ...]
+    evicted: Tuple[Calculation, ...] = ()
+    
+    def undo(self, history: Deque[Calculation]):
+        """Remove the calculations and restore the evicted entries."""
+        for _ in range(min(len(self.calculations), len(history))):
+            history.pop()
+        history.extendleft(reversed(self.evicted))
+    
+    def redo(self, history: Deque[Calculation]):
+        """Re-append the calculations; a full history evicts its oldest entries."""
+        history.extend(self.calculations)
+
+
+@dataclass
+class ClearCommand:
+    """Records a history clear as a single snapshot of the cleared entries."""
     
-    def __init__(self):
-        """Initialize the caretaker with empty undo/redo stacks."""
-        self._states: List[CalculatorMemento] = []
-        self._current_index: int = -1
+    snapshot: CalculatorMemento
     
-    def save_state(self, memento: CalculatorMemento):
+    def undo(self, history: Deque[Calculation]):
+        """Restore the cleared entries."""
+        history.extend(self.snapshot.state)
+    
+    def redo(self, history: Deque[Calculation]):
+        """Clear the history again."""
+        history.clear()
+
+
+HistoryCommand = Union[AddCalcCommand, AddBatchCommand, ClearCommand]
+
+
+class HistoryCaretaker:
+    """Manages history commands for undo/redo operations."""
+    
+    def __init__(self, max_undo_levels: int = 100):
         """
-        Save a new state and clear any future states.
+        Initialize the caretaker with empty undo/redo stacks.
         
         Args:
-            memento: Memento to save
+            max_undo_levels: Maximum number of commands kept for undo; the
+                oldest command is dropped once the limit is reached
+        """
+        self._undo_stack: Deque[HistoryCommand] = deque(maxlen=max_undo_levels)
+        self._redo_stack: Deque[HistoryCommand] = deque(maxlen=max_undo_levels)
+    
+    def save_command(self, command: HistoryCommand):
         """
-        # Remove any states after current index (for redo clear)
-        self._states = self._states[:self._current_index + 1]
+        Record a new command and clear any redoable commands.
         
-        # Add new state
-        self._states.append(memento)
-        self._current_index = len(self._states) - 1
+        Args:
+            command: Command that was just applied to the history
+        """
+        self._undo_stack.append(command)
+        self._redo_stack.clear()
     
-    def undo(self) -> Optional[CalculatorMemento]:
+    def undo(self) -> Optional[HistoryCommand]:
         """
-        Undo to previous state.
+        Take the most recent command off the undo stack.
         
         Returns:
-            Previous memento state, or None if can't undo
+            Command to undo, or None if can't undo
         """
         if not self.can_undo():
             return None
         
-        self._current_index -= 1
-        return self._states[self._current_index]
+        command = self._undo_stack.pop()
+        self._redo_stack.append(command)
+        return command
     
-    def redo(self) -> Optional[CalculatorMemento]:
+    def redo(self) -> Optional[HistoryCommand]:
         """
-        Redo to next state.
+        Take the most recently undone command off the redo stack.
         
         Returns:
-            Next memento state, or None if can't redo
+            Command to redo, or None if can't redo
         """
         if not self.can_redo():
             return None
         
-        self._current_index += 1
-        return self._states[self._current_index]
+        command = self._redo_stack.pop()
+        self._undo_stack.append(command)
+        return command
     
     def can_undo(self) -> bool:
         """Check if undo is possible."""
-        return self._current_index > 0
+        return len(self._undo_stack) > 0
     
     def can_redo(self) -> bool:
         """Check if redo is possible."""
-        return self._current_index < len(self._states) - 1
+        return len(self._redo_stack) > 0
+    
+    def clear_redo(self):
+        """Drop redoable commands after a change that records no command."""
+        self._redo_stack.clear()
     
     def clear(self):
         """Clear all undo/redo history."""
-        self._states.clear()
-        self._current_index = -1
+        self._undo_stack.clear()
+        self._redo_stack.clear()
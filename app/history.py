@@ -1,29 +1,56 @@
 """History management with pandas serialization."""
 
-from typing import List, Optional
+import csv
+import io
+import time
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from typing import Deque, Iterable, List, Optional
 from pathlib import Path
-import pandas as pd
 from app.calculation import Calculation
 from app.exceptions import HistoryError
-from app.calculator_memento import CalculatorMemento, HistoryCaretaker
+from app.calculator_memento import (
+    AddBatchCommand, AddCalcCommand, CalculatorMemento, ClearCommand, HistoryCaretaker
+)
+
+
+def _iso_epoch(timestamp: str) -> Optional[float]:
+    """Convert an ISO timestamp to epoch seconds, or None if unreadable."""
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        return None
 
 
 class CalculationHistory:
     """Manages calculation history with save/load capabilities."""
     
-    def __init__(self, max_size: int = 100):
+    _CSV_DTYPES = {
+        'operation': str,
+        'operand1': 'float64',
+        'operand2': 'float64',
+        'result': 'float64',
+        'timestamp': str,
+    }
+    
+    def __init__(self, max_size: int = 100, max_undo_levels: int = 100):
         """
         Initialize history manager.
         
         Args:
             max_size: Maximum number of calculations to store
+            max_undo_levels: Maximum number of steps that can be undone
         """
-        self._history: List[Calculation] = []
+        # A bounded deque evicts the oldest calculation in O(1) on append
+        self._history: Deque[Calculation] = deque(maxlen=max_size)
         self._max_size = max_size
-        self._caretaker = HistoryCaretaker()
-        
-        # Save initial empty state
-        self._caretaker.save_state(CalculatorMemento(self._history))
+        self._caretaker = HistoryCaretaker(max_undo_levels)
+    
+    @property
+    def max_size(self) -> int:
+        """Maximum number of calculations kept."""
+        return self._max_size
     
     def add_calculation(self, calculation: Calculation):
         """
@@ -32,25 +59,47 @@ class CalculationHistory:
         Args:
             calculation: Calculation to add
         """
+        # A zero-capacity history keeps nothing, so there is nothing to undo
+        if not self._max_size:
+            return
+        
+        # Remember which calculation the append will evict, if any
+        evicted = self._history[0] if len(self._history) == self._max_size else None
         self._history.append(calculation)
         
-        # Enforce max size
-        if len(self._history) > self._max_size:
-            self._history.pop(0)
+        # Record the append so it can be undone without copying history
+        self._caretaker.save_command(AddCalcCommand(calculation, evicted))
+    
+    def add_calculations_bulk(self, calculations: Iterable[Calculation]):
+        """
+        Add several calculations to history as a single undoable step.
         
-        # Save state after adding
-        self._caretaker.save_state(CalculatorMemento(self._history))
+        Args:
+            calculations: Calculations to add, oldest first
+        """
+        calculations = tuple(calculations)
+        if not calculations or not self._max_size:
+            return
+        
+        # Existing entries pushed out by the batch, for undo
+        overflow = len(self._history) + len(calculations) - self._max_size
+        evicted = tuple(islice(self._history, min(max(overflow, 0), len(self._history))))
+        self._history.extend(calculations)
+        
+        self._caretaker.save_command(AddBatchCommand(calculations, evicted))
     
     def get_history(self) -> List[Calculation]:
         """Return copy of calculation history."""
-        return self._history.copy()
+        return list(self._history)
     
     def clear_history(self):
-        """Clear all calculation history and undo/redo stacks."""
+        """Clear all calculation history as a single undoable step."""
+        if self._history:
+            self._caretaker.save_command(ClearCommand(CalculatorMemento(self._history)))
+        else:
+            # Nothing to snapshot, but an undone add must not be redone past a clear
+            self._caretaker.clear_redo()
         self._history.clear()
-        self._caretaker.clear()
-        # Save empty state
-        self._caretaker.save_state(CalculatorMemento(self._history))
     
     def get_last_calculation(self) -> Optional[Calculation]:
         """Return the most recent calculation."""
@@ -66,11 +115,11 @@ class CalculationHistory:
         if not self.can_undo():
             return False
         
-        memento = self._caretaker.undo()
-        if memento is None:
+        command = self._caretaker.undo()
+        if command is None:
             return False
         
-        self._history = memento.get_state()
+        command.undo(self._history)
         return True
     
     def redo(self) -> bool:
@@ -83,11 +132,11 @@ class CalculationHistory:
         if not self.can_redo():
             return False
         
-        memento = self._caretaker.redo()
-        if memento is None:
+        command = self._caretaker.redo()
+        if command is None:
             return False
         
-        self._history = memento.get_state()
+        command.redo(self._history)
         return True
     
     def can_undo(self) -> bool:
@@ -100,11 +149,11 @@ class CalculationHistory:
     
     def save_to_csv(self, filepath: str):
         """
-        Save history to CSV file using pandas.
+        Save history to CSV file.
         
         Args:
             filepath: Path to save the CSV file
-            
+        
         Raises:
             HistoryError: If saving fails
         """
@@ -112,12 +161,22 @@ class CalculationHistory:
             raise HistoryError("No history to save")
         
         try:
-            # Convert calculations to list of dictionaries
-            data = [calc.to_dict() for calc in self._history]
-            
-            # Create DataFrame and save to CSV
-            df = pd.DataFrame(data)
-            df.to_csv(filepath, index=False)
+            # Build every row up front and hand them to the C writer in one
+            # call; a 1 MiB buffer keeps large histories to a few writes
+            rows = [
+                (
+                    calc.operation,
+                    float(calc.operand1),
+                    float(calc.operand2),
+                    float(calc.result),
+                    datetime.fromtimestamp(calc.epoch).isoformat(),
+                )
+                for calc in self._history
+            ]
+            with open(filepath, 'w', newline='', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(self._CSV_DTYPES.keys())
+                writer.writerows(rows)
         except Exception as e:
             raise HistoryError(f"Failed to save history: {str(e)}")
     
@@ -125,32 +184,94 @@ class CalculationHistory:
         """
         Load history from CSV file using pandas.
         
+        Calculations an auto-save observer appended to the "<filepath>.wal"
+        log after its last snapshot are replayed on top of the CSV, so work
+        done before an unclean exit is not lost.
+        
         Args:
             filepath: Path to the CSV file
-            
+        
         Raises:
             HistoryError: If loading fails
         """
-        if not Path(filepath).exists():
+        snapshot = Path(filepath)
+        log = Path(f"{filepath}.wal")
+        # An auto-save observer creates its log up front, so only a log
+        # holding calculations counts as history on its own
+        has_log = log.exists() and log.stat().st_size > 0
+        if not snapshot.exists() and not has_log:
             raise HistoryError(f"History file not found: {filepath}")
         
+        import pandas as pd
+        
         try:
             # Read CSV into DataFrame
-            df = pd.read_csv(filepath)
+            if snapshot.exists():
+                df = pd.read_csv(filepath, dtype=self._CSV_DTYPES)
+            else:
+                df = pd.DataFrame({name: pd.Series(dtype=dtype)
+                                   for name, dtype in self._CSV_DTYPES.items()})
+            if has_log:
+                df = self._replay_log(df, log)
             
-            # Convert DataFrame rows to Calculation objects
-            self._history.clear()
-            for _, row in df.iterrows():
-                calc = Calculation.from_dict(row.to_dict())
-                self._history.append(calc)
+            # Only the newest max_size rows survive, so skip building the rest
+            start = max(len(df) - self._max_size, 0)
+            operations = df['operation'].tolist()[start:]
+            operands1 = df['operand1'].tolist()[start:]
+            operands2 = df['operand2'].tolist()[start:]
+            results = df['result'].tolist()[start:]
+            if 'timestamp' in df.columns:
+                epochs = [
+                    datetime.fromisoformat(ts).timestamp()
+                    for ts in df['timestamp'].tolist()[start:]
+                ]
+            else:
+                epochs = [time.time()] * len(operations)
+            
+            # Columns are already typed floats, so fill the slots directly
+            # rather than re-coercing through from_dict or __init__
+            history = map(Calculation._unsafe_new, operations, operands1, operands2, results, epochs)
+            self._history = deque(history, maxlen=self._max_size)
             
             # Clear undo/redo stacks after loading
             self._caretaker.clear()
-            # Save loaded state
-            self._caretaker.save_state(CalculatorMemento(self._history))
         except Exception as e:
             raise HistoryError(f"Failed to load history: {str(e)}")
     
+    def _replay_log(self, df, log: Path):
+        """
+        Append the log's calculations that are newer than the snapshot.
+        
+        Args:
+            df: Snapshot rows read from the CSV
+            log: Headerless log written by AutoSaveObserver
+        
+        Returns:
+            DataFrame of snapshot rows followed by the replayed rows
+        """
+        import pandas as pd
+        
+        # Only newline-terminated lines were written whole; a crash mid-write
+        # leaves a torn final line, which is skipped
+        text = log.read_text()
+        text = text[:text.rfind('\n') + 1]
+        if not text:
+            return df
+        replay = pd.read_csv(io.StringIO(text), header=None, names=list(self._CSV_DTYPES),
+                             dtype=self._CSV_DTYPES).dropna()
+        if 'timestamp' not in df.columns:
+            df = df.assign(timestamp=datetime.now().isoformat())
+        
+        # Lines already covered by the snapshot (a crash between writing it
+        # and truncating the log) must not be loaded twice, and lines with an
+        # unreadable timestamp are dropped rather than failing the load
+        last = _iso_epoch(df['timestamp'].iloc[-1]) if len(df) else None
+        keep = [
+            epoch is not None and (last is None or epoch > last)
+            for epoch in map(_iso_epoch, replay['timestamp'])
+        ]
+        return pd.concat([df, replay[keep]], ignore_index=True)
+    
     def __len__(self) -> int:
         """Return number of calculations in history."""
         return len(self._history)
@@ -1,6 +1,7 @@
 """Input validation module."""
 
-from typing import Tuple
+import math
+from typing import Iterable, Tuple
 from app.exceptions import ValidationError
 
 
@@ -15,16 +16,22 @@ class InputValidator:
         Args:
             value: String representation of a number
             max_value: Maximum allowed value (optional)
-            
+        
         Returns:
             Validated float value
-            
+        
         Raises:
             ValidationError: If validation fails
         """
+        # float() parses in C; digit-group underscores, infinities and NaN
+        # are the only inputs it accepts that are not plain numbers
         try:
+            if isinstance(value, str) and '_' in value:
+                raise ValueError(value)
             num = float(value)
-        except ValueError:
+        except (TypeError, ValueError):
+            raise ValidationError(f"Invalid number: '{value}'")
+        if not math.isfinite(num):
             raise ValidationError(f"Invalid number: '{value}'")
         
         if max_value is not None and abs(num) > max_value:
@@ -32,6 +39,73 @@ class InputValidator:
         
         return num
     
+    @staticmethod
+    def validate_number_unchecked(value, max_value: float = None) -> float:
+        """
+        Convert an already well-formed value to a float and check its range.
+        
+        Intended for trusted internal callers whose input is known to parse;
+        a malformed string raises ValueError instead of ValidationError.
+        
+        Args:
+            value: Number or numeric string
+            max_value: Maximum allowed value (optional)
+        
+        Returns:
+            Validated float value
+        
+        Raises:
+            ValidationError: If the value exceeds max_value
+        """
+        num = float(value)
+        
+        if max_value is not None and abs(num) > max_value:
+            raise ValidationError(f"Number {num} exceeds maximum allowed value {max_value}")
+        
+        return num
+    
+    @staticmethod
+    def validate_numbers(values: Iterable, max_value: float = None):
+        """
+        Validate and convert a batch of values to a float64 array in one pass.
+        
+        Args:
+            values: Numbers or numeric strings
+            max_value: Maximum allowed value (optional)
+        
+        Returns:
+            NumPy array of validated floats
+        
+        Raises:
+            ValidationError: If any value is invalid or exceeds max_value
+        """
+        import numpy as np
+        
+        # NumPy's parser has the same gaps as float(): digit-group underscores,
+        # infinities and NaN, which would also slip past the max comparison
+        if not (isinstance(values, np.ndarray) and values.dtype.kind in 'biuf'):
+            values = list(values)
+            for value in values:
+                if isinstance(value, str) and '_' in value:
+                    raise ValidationError(f"Invalid number: '{value}'")
+        
+        try:
+            numbers = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError) as e:
+            raise ValidationError(f"Invalid number: {str(e)}")
+        
+        finite = np.isfinite(numbers)
+        if not finite.all():
+            raise ValidationError(f"Invalid number: '{numbers[~finite][0]}'")
+        
+        if max_value is not None:
+            too_large = np.abs(numbers) > max_value
+            if too_large.any():
+                num = numbers[too_large][0]
+                raise ValidationError(f"Number {num} exceeds maximum allowed value {max_value}")
+        
+        return numbers
+    
     @staticmethod
     def validate_operands(operand1: str, operand2: str, max_value: float = None) -> Tuple[float, float]:
         """
@@ -41,10 +115,10 @@ class InputValidator:
             operand1: First operand as string
             operand2: Second operand as string
             max_value: Maximum allowed value (optional)
-            
+        
         Returns:
             Tuple of two validated floats
-            
+        
         Raises:
             ValidationError: If validation fails
         """
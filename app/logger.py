@@ -1,7 +1,11 @@
 """Logging configuration module."""
 
+import atexit
 import logging
 import os
+import queue
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
 
 
@@ -9,22 +13,43 @@ class Logger:
     """Manages application logging."""
     
     _logger = None
+    _listener = None
+    _target = None
+    _lock = threading.Lock()
     
     @classmethod
     def get_logger(cls, log_dir: str = "logs", log_file: str = "calculator.log") -> logging.Logger:
         """
         Get or create a logger instance.
         
+        The logger is rebuilt only when a different log file is requested.
+        
         Args:
             log_dir: Directory for log files
             log_file: Name of the log file
-            
+        
         Returns:
             Configured logger instance
         """
-        if cls._logger is not None:
+        target = (log_dir, log_file)
+        if cls._logger is not None and cls._target == target:
             return cls._logger
         
+        with cls._lock:
+            if cls._logger is None or cls._target != target:
+                cls._build(log_dir, log_file)
+                cls._target = target
+        return cls._logger
+    
+    @classmethod
+    def _build(cls, log_dir: str, log_file: str):
+        """
+        Configure the logger to write to the given log file.
+        
+        Args:
+            log_dir: Directory for log files
+            log_file: Name of the log file
+        """
         # Create logs directory if it doesn't exist
         log_path = Path(log_dir)
         log_path.mkdir(parents=True, exist_ok=True)
@@ -33,12 +58,12 @@ class Logger:
         cls._logger = logging.getLogger('calculator')
         cls._logger.setLevel(logging.DEBUG)
         
-        # Avoid adding duplicate handlers
-        if cls._logger.handlers:
-            return cls._logger
+        # Replace the handlers of any previous build
+        cls._stop_listener()
+        cls._logger.handlers.clear()
         
-        # Create file handler
-        file_handler = logging.FileHandler(log_path / log_file)
+        # Create file handler; the file is opened on the first record
+        file_handler = logging.FileHandler(log_path / log_file, delay=True)
         file_handler.setLevel(logging.DEBUG)
         
         # Create console handler
@@ -54,8 +79,49 @@ class Logger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        # Add handlers to logger
-        cls._logger.addHandler(file_handler)
-        cls._logger.addHandler(console_handler)
+        # Buffer file records so bulk runs write the log in batches; errors
+        # and shutdown flush immediately
+        buffered_file_handler = MemoryHandler(
+            capacity=32, flushLevel=logging.ERROR, target=file_handler
+        )
+        buffered_file_handler.setLevel(logging.DEBUG)
         
-        return cls._logger
+        # Write file records from a background thread so logging calls on the
+        # calculate() path only enqueue and never wait on file I/O
+        log_queue = queue.Queue(-1)
+        cls._listener = QueueListener(
+            log_queue, buffered_file_handler, respect_handler_level=True
+        )
+        cls._listener.start()
+        atexit.register(cls._stop_listener)
+        
+        # Add queue handler to logger; the console handler stays synchronous
+        # so messages print in order with the REPL's own output
+        cls._logger.addHandler(QueueHandler(log_queue))
+        cls._logger.addHandler(console_handler)
+    
+    @classmethod
+    def flush(cls):
+        """Wait for queued records to be handled and write any buffered ones."""
+        if cls._listener is None:
+            return
+        cls._listener.queue.join()
+        for handler in cls._listener.handlers:
+            handler.flush()
+    
+    @classmethod
+    def _stop_listener(cls):
+        """Stop the listener thread and close its handlers, flushing buffers."""
+        listener, cls._listener = cls._listener, None
+        if listener is None:
+            return
+        atexit.unregister(cls._stop_listener)
+        listener.stop()
+        for handler in listener.handlers:
+            # MemoryHandler drops its target on close without closing it
+            target = getattr(handler, 'target', None)
+            try:
+                handler.close()
+            finally:
+                if target is not None:
+                    target.close()
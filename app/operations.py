@@ -1,82 +1,83 @@
 """Operations module implementing the Factory Design Pattern."""
 
+import functools
+import sys
 from abc import ABC, abstractmethod
-from typing import Dict, Type
+from typing import Callable, Dict, Tuple, Type
 from app.exceptions import OperationError
 
 
 class Operation(ABC):
     """Abstract base class for all operations."""
     
+    # Symbol representing this operation, set by each subclass
+    symbol: str = ""
+    
     @abstractmethod
     def execute(self, a: float, b: float) -> float:
         """Execute the operation on two operands."""
         pass
     
-    @abstractmethod
     def get_symbol(self) -> str:
         """Return the symbol representing this operation."""
-        pass
+        return self.symbol
 
 
 class AddOperation(Operation):
     """Addition operation."""
     
+    symbol = "+"
+    
     def execute(self, a: float, b: float) -> float:
         return a + b
-    
-    def get_symbol(self) -> str:
-        return "+"
 
 
 class SubtractOperation(Operation):
     """Subtraction operation."""
     
+    symbol = "-"
+    
     def execute(self, a: float, b: float) -> float:
         return a - b
-    
-    def get_symbol(self) -> str:
-        return "-"
 
 
 class MultiplyOperation(Operation):
     """Multiplication operation."""
     
+    symbol = "*"
+    
     def execute(self, a: float, b: float) -> float:
         return a * b
-    
-    def get_symbol(self) -> str:
-        return "*"
 
 
 class DivideOperation(Operation):
     """Division operation."""
     
+    symbol = "/"
+    
     def execute(self, a: float, b: float) -> float:
         if b == 0:
             raise OperationError("Cannot divide by zero")
         return a / b
-    
-    def get_symbol(self) -> str:
-        return "/"
 
 
 class PowerOperation(Operation):
     """Power operation (a^b)."""
     
+    symbol = "^"
+    
     def execute(self, a: float, b: float) -> float:
         try:
             return a ** b
         except (ValueError, OverflowError) as e:
             raise OperationError(f"Power operation failed: {str(e)}")
-    
-    def get_symbol(self) -> str:
-        return "^"
 
 
 class RootOperation(Operation):
     """Root operation (nth root of a)."""
     
+    symbol = "√"
+    
     def execute(self, a: float, b: float) -> float:
         if b == 0:
             raise OperationError("Cannot calculate 0th root")
@@ -86,55 +87,48 @@ class RootOperation(Operation):
             return a ** (1 / b)
         except (ValueError, OverflowError) as e:
             raise OperationError(f"Root operation failed: {str(e)}")
-    
-    def get_symbol(self) -> str:
-        return "√"
 
 
 class ModulusOperation(Operation):
     """Modulus operation (remainder)."""
     
+    symbol = "%"
+    
     def execute(self, a: float, b: float) -> float:
         if b == 0:
             raise OperationError("Cannot perform modulus with zero")
         return a % b
-    
-    def get_symbol(self) -> str:
-        return "%"
 
 
 class IntDivideOperation(Operation):
     """Integer division operation."""
     
+    symbol = "//"
+    
     def execute(self, a: float, b: float) -> float:
         if b == 0:
             raise OperationError("Cannot divide by zero")
         return a // b
-    
-    def get_symbol(self) -> str:
-        return "//"
 
 
 class PercentageOperation(Operation):
     """Percentage calculation (a/b * 100)."""
     
+    symbol = "%of"
+    
     def execute(self, a: float, b: float) -> float:
         if b == 0:
             raise OperationError("Cannot calculate percentage with zero denominator")
         return (a / b) * 100
-    
-    def get_symbol(self) -> str:
-        return "%of"
 
 
 class AbsDifferenceOperation(Operation):
     """Absolute difference operation."""
     
+    symbol = "abs_diff"
+    
     def execute(self, a: float, b: float) -> float:
         return abs(a - b)
-    
-    def get_symbol(self) -> str:
-        return "abs_diff"
 
 
 class OperationFactory:
@@ -153,26 +147,112 @@ class OperationFactory:
         'abs_diff': AbsDifferenceOperation,
     }
     
+    # Operations are stateless, so one shared instance per name is enough;
+    # interned keys let lookups with interned names match by identity
+    _instances: Dict[str, Operation] = {
+        sys.intern(name): operation_class() for name, operation_class in _operations.items()
+    }
+    
+    # Names in registration order, returned without copying
+    _available: Tuple[str, ...] = tuple(_instances)
+    
     @classmethod
     def create_operation(cls, operation_name: str) -> Operation:
         """
-        Create an operation instance based on the operation name.
+        Get the operation instance for the operation name.
         
         Args:
             operation_name: Name of the operation
-            
+        
         Returns:
-            Operation instance
-            
+            Shared operation instance
+        
         Raises:
             OperationError: If operation name is not recognized
         """
-        operation_class = cls._operations.get(operation_name.lower())
-        if operation_class is None:
+        # Canonical lowercase names skip the lower() allocation
+        operation = cls._instances.get(operation_name)
+        if operation is None:
+            operation = cls._lookup_normalized(operation_name)
+        return operation
+    
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _lookup_normalized(cls, operation_name: str) -> Operation:
+        """Resolve a non-canonical name, memoizing repeated spellings."""
+        try:
+            return cls._instances[operation_name.lower()]
+        except KeyError:
             raise OperationError(f"Unknown operation: {operation_name}")
-        return operation_class()
     
     @classmethod
-    def get_available_operations(cls) -> list:
-        """Return list of available operation names."""
-        return list(cls._operations.keys())
+    def get_available_operations(cls) -> Tuple[str, ...]:
+        """Return the available operation names."""
+        return cls._available
+
+
+# Messages match the scalar operations so callers see the same errors
+_ZERO_DIVISOR_ERRORS: Dict[str, str] = {
+    'divide': "Cannot divide by zero",
+    'root': "Cannot calculate 0th root",
+    'modulus': "Cannot perform modulus with zero",
+    'int_divide': "Cannot divide by zero",
+    'percent': "Cannot calculate percentage with zero denominator",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _ufunc_table() -> Dict[str, Callable]:
+    """Map operation names to NumPy equivalents, importing NumPy on first use."""
+    import numpy as np
+    
+    return {
+        'add': np.add,
+        'subtract': np.subtract,
+        'multiply': np.multiply,
+        'divide': np.divide,
+        'power': np.power,
+        'root': lambda a, b: np.power(a, 1 / b),
+        'modulus': np.mod,
+        'int_divide': np.floor_divide,
+        'percent': lambda a, b: np.divide(a, b) * 100,
+        'abs_diff': lambda a, b: np.abs(np.subtract(a, b)),
+    }
+
+
+def execute_vectorized(operation_name: str, a, b):
+    """
+    Execute an operation element-wise over arrays of operands.
+    
+    Args:
+        operation_name: Name of the operation
+        a: First operands (array-like)
+        b: Second operands (array-like)
+    
+    Returns:
+        NumPy float64 array of results
+    
+    Raises:
+        OperationError: If the operation is unknown, any operand pair is
+            invalid, or any result is not finite
+    """
+    import numpy as np
+    
+    name = operation_name.lower()
+    ufunc = _ufunc_table().get(name)
+    if ufunc is None:
+        raise OperationError(f"Unknown operation: {operation_name}")
+    
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    
+    if name in _ZERO_DIVISOR_ERRORS and np.any(b == 0):
+        raise OperationError(_ZERO_DIVISOR_ERRORS[name])
+    if name == 'root' and np.any((a < 0) & (b % 2 == 0)):
+        raise OperationError("Cannot calculate even root of negative number")
+    
+    with np.errstate(all='ignore'):
+        result = ufunc(a, b)
+    if not np.all(np.isfinite(result)):
+        raise OperationError(f"{name} operation produced a non-finite result")
+    return result
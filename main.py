@@ -1,5 +1,6 @@
 """Main REPL interface for the calculator application."""
 
+import os
 import sys
 from colorama import Fore, Style, init
 from app.calculator import Calculator
@@ -18,28 +19,80 @@ class CalculatorREPL:
         self.calculator = Calculator()
         self.running = True
         self.validator = InputValidator()
+        
+        # Static screens are rendered once and written in a single call
+        self._welcome_buf = self._render_welcome()
+        self._help_buf = self._render_help()
+        
+        self._command_prompt = f"{Fore.MAGENTA}calculator> {Style.RESET_ALL}"
+        self._operand1_prompt = f"{Fore.YELLOW}Enter first number: {Style.RESET_ALL}"
+        self._operand2_prompt = f"{Fore.YELLOW}Enter second number: {Style.RESET_ALL}"
+        
+        # Command dispatch table, built once
+        self._dispatch = {
+            'help': self.display_help,
+            'history': self.handle_history,
+            'clear': self.handle_clear,
+            'undo': self.handle_undo,
+            'redo': self.handle_redo,
+            'save': self.handle_save,
+            'load': self.handle_load,
+            'exit': self.handle_exit,
+        }
     
-    def display_welcome(self):
-        """Display welcome message."""
-        print(f"{Fore.CYAN}{'=' * 60}")
-        print(f"{Fore.CYAN}{'Advanced Calculator Application':^60}")
-        print(f"{Fore.CYAN}{'=' * 60}")
-        print(f"{Fore.GREEN}Type 'help' for available commands")
-        print(f"{Fore.CYAN}{'=' * 60}\n")
+    def _read_line(self, prompt: str) -> str:
+        """
+        Prompt for and read one line of input.
+        
+        On a terminal the prompt goes straight to the stdout file descriptor,
+        bypassing Python's buffering; otherwise input() is used.
+        
+        Args:
+            prompt: Prompt text to display
+        
+        Returns:
+            Line entered, without the trailing newline
+        
+        Raises:
+            EOFError: If input has ended
+        """
+        if not sys.stdin.isatty():
+            return input(prompt)
+        
+        # Anything still buffered must reach the terminal before the prompt
+        sys.stdout.flush()
+        os.write(sys.stdout.fileno(), prompt.encode())
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
     
-    def display_help(self):
-        """Display help information."""
-        print(f"\n{Fore.YELLOW}Available Commands:")
-        print(f"{Fore.CYAN}{'=' * 60}")
+    def _render_welcome(self) -> str:
+        """Build the welcome message text."""
+        lines = [
+            f"{Fore.CYAN}{'=' * 60}",
+            f"{Fore.CYAN}{'Advanced Calculator Application':^60}",
+            f"{Fore.CYAN}{'=' * 60}",
+            f"{Fore.GREEN}Type 'help' for available commands",
+            f"{Fore.CYAN}{'=' * 60}\n",
+        ]
+        return "\n".join(lines) + "\n"
+    
+    def _render_help(self) -> str:
+        """Build the help text."""
+        lines = [
+            f"\n{Fore.YELLOW}Available Commands:",
+            f"{Fore.CYAN}{'=' * 60}",
+        ]
         
         # Arithmetic operations
-        print(f"\n{Fore.GREEN}Arithmetic Operations:")
+        lines.append(f"\n{Fore.GREEN}Arithmetic Operations:")
         operations = self.calculator.get_available_operations()
         for op in operations:
-            print(f"  {Fore.WHITE}{op:15} - Perform {op} operation")
+            lines.append(f"  {Fore.WHITE}{op:15} - Perform {op} operation")
         
         # Utility commands
-        print(f"\n{Fore.GREEN}Utility Commands:")
+        lines.append(f"\n{Fore.GREEN}Utility Commands:")
         commands = {
             'history': 'Display calculation history',
             'clear': 'Clear calculation history',
@@ -51,9 +104,20 @@ class CalculatorREPL:
             'exit': 'Exit the application'
         }
         for cmd, desc in commands.items():
-            print(f"  {Fore.WHITE}{cmd:15} - {desc}")
+            lines.append(f"  {Fore.WHITE}{cmd:15} - {desc}")
         
-        print(f"{Fore.CYAN}{'=' * 60}\n")
+        lines.append(f"{Fore.CYAN}{'=' * 60}\n")
+        return "\n".join(lines) + "\n"
+    
+    def display_welcome(self):
+        """Display welcome message."""
+        sys.stdout.write(self._welcome_buf)
+        sys.stdout.flush()
+    
+    def display_help(self):
+        """Display help information."""
+        sys.stdout.write(self._help_buf)
+        sys.stdout.flush()
     
     def handle_operation(self, operation: str):
         """
@@ -64,8 +128,8 @@ class CalculatorREPL:
         """
         try:
             # Get operands from user
-            operand1 = input(f"{Fore.YELLOW}Enter first number: {Style.RESET_ALL}")
-            operand2 = input(f"{Fore.YELLOW}Enter second number: {Style.RESET_ALL}")
+            operand1 = self._read_line(self._operand1_prompt)
+            operand2 = self._read_line(self._operand2_prompt)
             
             # Validate operands
             a, b = self.validator.validate_operands(
@@ -95,11 +159,11 @@ class CalculatorREPL:
             print(f"{Fore.YELLOW}No calculations in history.\n")
             return
         
-        print(f"\n{Fore.CYAN}Calculation History:")
-        print(f"{Fore.CYAN}{'=' * 60}")
-        for i, calc in enumerate(history, 1):
-            print(f"{Fore.WHITE}{i}. {calc}")
-        print(f"{Fore.CYAN}{'=' * 60}\n")
+        lines = [f"\n{Fore.CYAN}Calculation History:", f"{Fore.CYAN}{'=' * 60}"]
+        lines.extend(f"{Fore.WHITE}{i}. {calc}" for i, calc in enumerate(history, 1))
+        lines.append(f"{Fore.CYAN}{'=' * 60}\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     def handle_clear(self):
         """Clear calculation history."""
@@ -138,6 +202,7 @@ class CalculatorREPL:
     
     def handle_exit(self):
         """Exit the application."""
+        self.calculator.close()
         print(f"{Fore.CYAN}Thank you for using the calculator. Goodbye!\n")
         self.running = False
     
@@ -148,33 +213,23 @@ class CalculatorREPL:
         while self.running:
             try:
                 # Get user input
-                command = input(f"{Fore.MAGENTA}calculator> {Style.RESET_ALL}").strip().lower()
+                command = self._read_line(self._command_prompt).strip().lower()
                 
                 if not command:
                     continue
                 
                 # Handle commands
-                if command == 'help':
-                    self.display_help()
-                elif command == 'history':
-                    self.handle_history()
-                elif command == 'clear':
-                    self.handle_clear()
-                elif command == 'undo':
-                    self.handle_undo()
-                elif command == 'redo':
-                    self.handle_redo()
-                elif command == 'save':
-                    self.handle_save()
-                elif command == 'load':
-                    self.handle_load()
-                elif command == 'exit':
-                    self.handle_exit()
-                elif command in self.calculator.get_available_operations():
+                handler = self._dispatch.get(command)
+                if handler is not None:
+                    handler()
+                elif self.calculator.is_available_operation(command):
                     self.handle_operation(command)
                 else:
                     print(f"{Fore.RED}Unknown command: '{command}'. Type 'help' for available commands.\n")
             
+            except EOFError:
+                print()
+                self.handle_exit()
             except KeyboardInterrupt:
                 print(f"\n{Fore.YELLOW}Use 'exit' command to quit.\n")
             except Exception as e:
@@ -0,0 +1,13 @@
+"""Shared test fixtures."""
+
+import pytest
+from app.operations import OperationFactory
+
+
+@pytest.fixture(scope="session")
+def ops():
+    """Operation instances keyed by name, shared across the test session."""
+    return {
+        name: OperationFactory.create_operation(name)
+        for name in OperationFactory.get_available_operations()
+    }
@@ -0,0 +1,31 @@
+"""Shared test helpers, imported by test modules."""
+
+import re
+
+# Error messages checked by more than one test module
+DIVIDE_BY_ZERO = re.compile("Cannot divide by zero")
+UNKNOWN_OPERATION = re.compile("Unknown operation")
+
+
+def assert_raises(exc, pattern, fn, *args, **kwargs):
+    """
+    Assert that calling fn raises exc with a message matching pattern.
+    
+    A lighter alternative to pytest.raises for tests that only check the
+    exception type and message.
+    
+    Args:
+        exc: Expected exception type
+        pattern: Regex string or compiled pattern searched in the message,
+            or None to skip the message check
+        fn: Callable to invoke
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+    """
+    try:
+        fn(*args, **kwargs)
+    except exc as e:
+        if pattern is not None and not re.search(pattern, str(e)):
+            raise AssertionError(f"{exc.__name__} message {str(e)!r} does not match {pattern!r}")
+        return
+    raise AssertionError(f"{exc.__name__} not raised")
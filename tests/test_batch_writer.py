@@ -0,0 +1,94 @@
+"""Tests for batched append-only writer."""
+
+import pytest
+from app.batch_writer import BatchWriter
+
+
+def test_batch_writer_queues_until_batch_full(tmp_path):
+    """Test writes are held until the batch is full."""
+    filepath = tmp_path / 'log.txt'
+    writer = BatchWriter(str(filepath), batch_size=3)
+    
+    writer.write(b'one\n')
+    writer.write(b'two\n')
+    assert filepath.read_bytes() == b''
+    
+    writer.write(b'three\n')
+    assert filepath.read_bytes() == b'one\ntwo\nthree\n'
+    writer.close()
+
+
+def test_batch_writer_drain(tmp_path):
+    """Test drain writes a partial batch."""
+    filepath = tmp_path / 'log.txt'
+    writer = BatchWriter(str(filepath), batch_size=10)
+    
+    writer.write(b'one\n')
+    writer.drain()
+    
+    assert filepath.read_bytes() == b'one\n'
+    writer.close()
+
+
+def test_batch_writer_appends_to_existing_file(tmp_path):
+    """Test writer appends instead of overwriting."""
+    filepath = tmp_path / 'log.txt'
+    filepath.write_bytes(b'existing\n')
+    
+    writer = BatchWriter(str(filepath), batch_size=1)
+    writer.write(b'new\n')
+    writer.close()
+    
+    assert filepath.read_bytes() == b'existing\nnew\n'
+
+
+def test_batch_writer_truncate(tmp_path):
+    """Test truncate empties the file and drops queued data."""
+    filepath = tmp_path / 'log.txt'
+    writer = BatchWriter(str(filepath), batch_size=2)
+    writer.write(b'one\n')
+    writer.write(b'two\n')
+    writer.write(b'queued\n')
+    
+    writer.truncate()
+    writer.write(b'three\n')
+    writer.close()
+    
+    assert filepath.read_bytes() == b'three\n'
+
+
+def test_batch_writer_close(tmp_path):
+    """Test close writes queued data and can be called twice."""
+    filepath = tmp_path / 'log.txt'
+    writer = BatchWriter(str(filepath), batch_size=10)
+    writer.write(b'one\n')
+    
+    writer.close()
+    writer.close()
+    
+    assert writer.closed is True
+    assert filepath.read_bytes() == b'one\n'
+
+
+def test_batch_writer_dropped_without_close(tmp_path):
+    """Test a writer dropped without close still writes queued data."""
+    import gc
+    
+    filepath = tmp_path / 'log.txt'
+    writer = BatchWriter(str(filepath), batch_size=10)
+    writer.write(b'one\n')
+    
+    del writer
+    gc.collect()
+    
+    assert filepath.read_bytes() == b'one\n'
+
+
+def test_batch_writer_rejects_use_after_close(tmp_path):
+    """Test writing to a closed writer raises a clear error."""
+    writer = BatchWriter(str(tmp_path / 'log.txt'))
+    writer.close()
+    
+    for method, args in ((writer.write, (b'one\n',)), (writer.drain, ()), (writer.truncate, ())):
+        with pytest.raises(ValueError, match="writer is closed"):
+            method(*args)
@@ -1,6 +1,7 @@
 """Tests for Calculation class."""
 
 import pytest
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 from app.calculation import Calculation
 
@@ -15,6 +16,38 @@ def test_calculation_init():
     assert isinstance(calc.timestamp, datetime)
 
 
+def test_calculation_stores_epoch():
+    """Test Calculation stores its time as epoch seconds."""
+    calc = Calculation('add', 5.0, 3.0, 8.0)
+    assert isinstance(calc.epoch, float)
+    assert calc.timestamp == datetime.fromtimestamp(calc.epoch)
+
+
+def test_calculation_explicit_epoch():
+    """Test Calculation accepts an explicit epoch."""
+    epoch = datetime(2025, 10, 27, 10, 30).timestamp()
+    calc = Calculation('add', 5.0, 3.0, 8.0, epoch)
+    
+    assert calc.timestamp == datetime(2025, 10, 27, 10, 30)
+    assert calc.to_dict()['timestamp'] == '2025-10-27T10:30:00'
+
+
+def test_calculation_is_frozen():
+    """Test Calculation fields cannot be reassigned."""
+    calc = Calculation('add', 5.0, 3.0, 8.0)
+    with pytest.raises(FrozenInstanceError):
+        calc.result = 9.0
+
+
+def test_calculation_equality_and_hash():
+    """Test calculations compare and hash by value."""
+    calc1 = Calculation('add', 5.0, 3.0, 8.0, 1.0)
+    calc2 = Calculation('add', 5.0, 3.0, 8.0, 1.0)
+    
+    assert calc1 == calc2
+    assert hash(calc1) == hash(calc2)
+
+
 def test_calculation_repr():
     """Test Calculation repr."""
     calc = Calculation('subtract', 10.0, 4.0, 6.0)
@@ -44,6 +77,29 @@ def test_calculation_to_dict():
     assert 'timestamp' in calc_dict
 
 
+def test_calculation_to_dict_returns_fresh_dict():
+    """Test modifying a to_dict result does not affect later calls."""
+    calc = Calculation('add', 1.0, 2.0, 3.0)
+    calc.to_dict()['result'] = 99.0
+    assert calc.to_dict()['result'] == 3.0
+
+
+def test_calculation_has_no_instance_dict():
+    """Test Calculation uses slots instead of a per-instance dict."""
+    calc = Calculation('add', 1.0, 2.0, 3.0)
+    assert not hasattr(calc, '__dict__')
+
+
+def test_calculation_unsafe_new_matches_init():
+    """Test the bulk-load constructor builds an equal, usable calculation."""
+    calc = Calculation._unsafe_new('add', 5.0, 3.0, 8.0, 1.0)
+    
+    assert calc == Calculation('add', 5.0, 3.0, 8.0, 1.0)
+    assert calc.to_dict()['operation'] == 'add'
+    with pytest.raises(FrozenInstanceError):
+        calc.result = 9.0
+
+
 def test_calculation_from_dict():
     """Test Calculation from_dict method."""
     data = {
@@ -59,6 +115,7 @@ def test_calculation_from_dict():
     assert calc.operand1 == 2.0
     assert calc.operand2 == 3.0
     assert calc.result == 8.0
+    assert calc.timestamp == datetime(2025, 10, 27, 10, 30)
 
 
 def test_calculation_from_dict_without_timestamp():
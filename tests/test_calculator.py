@@ -1,18 +1,23 @@
 """Tests for Calculator class."""
 
 import pytest
+import os
+import sys
 import tempfile
 from pathlib import Path
 from app.calculator import Calculator, LoggingObserver, AutoSaveObserver
 from app.calculator_config import CalculatorConfig
 from app.calculation import Calculation
 from app.exceptions import OperationError
+from tests.helpers import DIVIDE_BY_ZERO, UNKNOWN_OPERATION
 
 
 @pytest.fixture
 def calculator():
     """Create a calculator instance for testing."""
-    return Calculator()
+    calc = Calculator()
+    yield calc
+    calc.close()
 
 
 def test_calculator_init(calculator):
@@ -49,7 +54,7 @@ def test_calculator_divide(calculator):
 
 def test_calculator_divide_by_zero(calculator):
     """Test division by zero raises error."""
-    with pytest.raises(OperationError, match="Cannot divide by zero"):
+    with pytest.raises(OperationError, match=DIVIDE_BY_ZERO):
         calculator.calculate('divide', 10, 0)
 
 
@@ -89,9 +94,46 @@ def test_calculator_abs_diff(calculator):
     assert result == 7
 
 
+def test_calculator_operation_case_insensitive(calculator):
+    """Test operation names are case insensitive."""
+    assert calculator.calculate('ADD', 5, 3) == 8
+
+
+def test_calculator_dispatch_skips_factory(calculator, monkeypatch):
+    """Test calculate dispatches from the prebuilt table, not the factory."""
+    def fail(name):
+        raise AssertionError("factory called during calculate")
+    
+    monkeypatch.setattr('app.operations.OperationFactory.create_operation', fail)
+    
+    assert calculator.calculate('add', 5, 3) == 8
+    assert calculator.calculate('DIVIDE', 10, 4) == 2.5
+
+
+def test_calculator_repeated_calculation_recorded(calculator):
+    """Test repeated calculations are each recorded in history."""
+    calculator.calculate('add', 5, 3)
+    calculator.calculate('add', 5, 3)
+    
+    assert len(calculator.get_history()) == 2
+
+
+def test_calculator_cached_result_keeps_type(calculator):
+    """Test int and float operands do not share cached results."""
+    assert type(calculator.calculate('add', 5, 3)) is int
+    assert type(calculator.calculate('add', 5.0, 3.0)) is float
+
+
+def test_calculator_failures_not_cached(calculator):
+    """Test failing calculations raise on every call."""
+    for _ in range(2):
+        with pytest.raises(OperationError, match=DIVIDE_BY_ZERO):
+            calculator.calculate('divide', 5, 0)
+
+
 def test_calculator_unknown_operation(calculator):
     """Test unknown operation raises error."""
-    with pytest.raises(OperationError, match="Unknown operation"):
+    with pytest.raises(OperationError, match=UNKNOWN_OPERATION):
         calculator.calculate('invalid', 5, 3)
 
 
@@ -101,6 +143,16 @@ def test_calculator_precision(calculator):
     assert result == 3.33  # Default precision is 2
 
 
+def test_calculator_custom_precision(monkeypatch):
+    """Test results are rounded to the configured precision."""
+    monkeypatch.setenv('CALCULATOR_PRECISION', '4')
+    calc = Calculator()
+    try:
+        assert calc.calculate('divide', 10, 3) == 3.3333
+    finally:
+        calc.close()
+
+
 def test_calculator_history_tracking(calculator):
     """Test calculations are added to history."""
     calculator.calculate('add', 5, 3)
@@ -190,6 +242,20 @@ def test_calculator_get_available_operations(calculator):
     assert len(operations) == 10
 
 
+def test_calculator_available_operations_cached(calculator):
+    """Test available operations are a shared tuple of interned names."""
+    operations = calculator.get_available_operations()
+    assert isinstance(operations, tuple)
+    assert calculator.get_available_operations() is operations
+    assert all(sys.intern(name) is name for name in operations)
+
+
+def test_calculator_is_available_operation(calculator):
+    """Test operation membership check."""
+    assert calculator.is_available_operation('add')
+    assert not calculator.is_available_operation('history')
+
+
 def test_calculator_observer_notification(calculator):
     """Test observers are notified of calculations."""
     notified = []
@@ -226,6 +292,94 @@ def test_calculator_remove_observer(calculator):
     assert len(notified) == 1
 
 
+def test_calculator_calculate_bulk(calculator):
+    """Test bulk calculation records every result."""
+    results = calculator.calculate_bulk('divide', [10, 9], [4, 3])
+    
+    assert results == [2.5, 3]
+    assert [c.result for c in calculator.get_history()] == [2.5, 3]
+
+
+def test_calculator_calculate_bulk_is_atomic(calculator):
+    """Test a failing pair leaves history untouched."""
+    with pytest.raises(OperationError, match=DIVIDE_BY_ZERO):
+        calculator.calculate_bulk('divide', [10, 9], [2, 0])
+    
+    assert calculator.get_history() == []
+
+
+def test_calculator_calculate_bulk_length_mismatch(calculator):
+    """Test operand lists of different lengths raise an error."""
+    with pytest.raises(OperationError, match="same length"):
+        calculator.calculate_bulk('add', [1, 2], [3])
+
+
+def test_calculator_calculate_bulk_empty(calculator):
+    """Test an empty bulk calculation records and notifies nothing."""
+    notified = []
+    
+    class BatchObserver:
+        def update(self, calculation):
+            notified.append(calculation)
+        
+        def update_batch(self, calculations):
+            notified.append(calculations)
+    
+    calculator.add_observer(BatchObserver())
+    
+    assert calculator.calculate_bulk('add', [], []) == []
+    assert notified == []
+    assert calculator.history.can_undo() is False
+    with pytest.raises(OperationError, match=UNKNOWN_OPERATION):
+        calculator.calculate_bulk('unknown', [], [])
+
+
+def test_calculator_calculate_bulk_notifies_once(calculator):
+    """Test batch-aware observers are notified once per batch."""
+    batches = []
+    singles = []
+    
+    class BatchObserver:
+        def update(self, calculation):
+            singles.append(calculation)
+        
+        def update_batch(self, calculations):
+            batches.append(calculations)
+    
+    class SingleObserver:
+        def update(self, calculation):
+            singles.append(calculation)
+    
+    calculator.add_observer(BatchObserver())
+    calculator.add_observer(SingleObserver())
+    calculator.calculate_bulk('add', [1, 2, 3], [1, 1, 1])
+    
+    assert len(batches) == 1
+    assert len(batches[0]) == 3
+    assert len(singles) == 3
+
+
+def test_calculator_calculate_many(calculator):
+    """Test vectorized calculation rounds and records nothing."""
+    results = calculator.calculate_many('divide', [10, 1], [3, 4])
+    
+    assert results.tolist() == [3.33, 0.25]
+    assert calculator.get_history() == []
+
+
+def test_calculator_calculate_many_matches_scalar(calculator):
+    """Test vectorized results match scalar results for every operation."""
+    for operation in calculator.get_available_operations():
+        expected = calculator.calculate(operation, 27, 3)
+        assert calculator.calculate_many(operation, [27], [3]).tolist() == [expected]
+
+
+def test_calculator_calculate_many_unknown_operation(calculator):
+    """Test vectorized calculation rejects unknown operations."""
+    with pytest.raises(OperationError, match=UNKNOWN_OPERATION):
+        calculator.calculate_many('invalid', [1], [2])
+
+
 def test_logging_observer():
     """Test LoggingObserver logs calculations."""
     from app.logger import Logger
@@ -238,6 +392,24 @@ def test_logging_observer():
     observer.update(calc)
 
 
+def test_logging_observer_skips_disabled_level():
+    """Test LoggingObserver does not log when INFO is disabled."""
+    class QuietLogger:
+        def __init__(self):
+            self.messages = []
+        
+        def isEnabledFor(self, level):
+            return False
+        
+        def info(self, message):
+            self.messages.append(message)
+    
+    logger = QuietLogger()
+    LoggingObserver(logger).update(Calculation('add', 5, 3, 8))
+    
+    assert logger.messages == []
+
+
 def test_auto_save_observer():
     """Test AutoSaveObserver saves history."""
     from app.history import CalculationHistory
@@ -249,14 +421,220 @@ def test_auto_save_observer():
         filepath = f.name
     
     try:
-        observer = AutoSaveObserver(history, filepath)
+        observer = AutoSaveObserver(history, filepath, flush_interval=1)
         calc = Calculation('multiply', 4, 5, 20)
         history.add_calculation(calc)
         
         # Trigger auto-save
         observer.update(calc)
+        observer.close()
         
         assert Path(filepath).exists()
+        assert len(Path(filepath).read_text().splitlines()) == 3
     finally:
-        if Path(filepath).exists():
-            Path(filepath).unlink()
+        for path in (Path(filepath), Path(f"{filepath}.wal")):
+            if path.exists():
+                path.unlink()
+
+
+def test_auto_save_observer_appends_to_log_between_snapshots(tmp_path):
+    """Test AutoSaveObserver only snapshots every flush_interval updates."""
+    from app.history import CalculationHistory
+    
+    history = CalculationHistory()
+    filepath = tmp_path / 'history.csv'
+    wal_path = tmp_path / 'history.csv.wal'
+    observer = AutoSaveObserver(history, str(filepath), flush_interval=6, max_delay=60)
+    
+    def add(operand):
+        calc = Calculation('add', operand, 1, operand + 1)
+        history.add_calculation(calc)
+        observer.update(calc)
+    
+    for operand in range(4):
+        add(operand)
+    
+    assert not filepath.exists()
+    assert len(wal_path.read_text().splitlines()) == 4
+    
+    for operand in range(4, 6):
+        add(operand)
+    
+    assert len(filepath.read_text().splitlines()) == 7
+    assert wal_path.read_text() == ''
+    observer.close()
+
+
+def test_auto_save_observer_flushes_after_max_delay(tmp_path):
+    """Test AutoSaveObserver snapshots once max_delay has passed."""
+    from app.history import CalculationHistory
+    
+    history = CalculationHistory()
+    filepath = tmp_path / 'history.csv'
+    observer = AutoSaveObserver(history, str(filepath), flush_interval=10, max_delay=0)
+    calc = Calculation('add', 5, 3, 8)
+    history.add_calculation(calc)
+    
+    observer.update(calc)
+    
+    assert len(filepath.read_text().splitlines()) == 2
+    observer.close()
+
+
+def test_auto_save_observer_update_batch(tmp_path):
+    """Test AutoSaveObserver snapshots once for a batch."""
+    from app.history import CalculationHistory
+    
+    history = CalculationHistory()
+    filepath = tmp_path / 'history.csv'
+    observer = AutoSaveObserver(history, str(filepath), flush_interval=10)
+    calcs = [Calculation('add', operand, 1, operand + 1) for operand in range(3)]
+    history.add_calculations_bulk(calcs)
+    
+    observer.update_batch(calcs)
+    
+    assert len(filepath.read_text().splitlines()) == 4
+    observer.close()
+
+
+def test_auto_save_observer_close_drains_log(tmp_path):
+    """Test closing AutoSaveObserver writes pending calculations to CSV."""
+    from app.history import CalculationHistory
+    
+    history = CalculationHistory()
+    filepath = tmp_path / 'history.csv'
+    observer = AutoSaveObserver(history, str(filepath), flush_interval=10)
+    calc = Calculation('add', 5, 3, 8)
+    history.add_calculation(calc)
+    observer.update(calc)
+    
+    observer.close()
+    observer.close()
+    
+    assert len(filepath.read_text().splitlines()) == 2
+    assert (tmp_path / 'history.csv.wal').read_text() == ''
+
+
+def test_auto_save_observer_is_collected_without_close(tmp_path):
+    """Test dropped AutoSaveObservers are not kept alive until exit."""
+    import gc
+    import weakref
+    from app.history import CalculationHistory
+    
+    refs = [weakref.ref(AutoSaveObserver(CalculationHistory(), str(tmp_path / f'h{i}.csv')))
+            for i in range(200)]
+    gc.collect()
+    
+    assert all(ref() is None for ref in refs)
+
+
+@pytest.mark.skipif(not os.path.isdir('/proc/self/fd'), reason="needs /proc/self/fd")
+def test_dropped_calculators_release_file_descriptors(tmp_path, monkeypatch):
+    """Test calculators dropped without close() do not leak descriptors."""
+    import gc
+    
+    monkeypatch.setenv('CALCULATOR_HISTORY_DIR', str(tmp_path))
+    Calculator().close()
+    gc.collect()
+    before = len(os.listdir('/proc/self/fd'))
+    
+    for _ in range(100):
+        Calculator()
+    gc.collect()
+    
+    assert len(os.listdir('/proc/self/fd')) <= before
+
+
+def test_auto_save_observer_recovers_log_after_crash(tmp_path):
+    """Test calculations logged before a crash survive into the next run."""
+    import shutil
+    from app.history import CalculationHistory
+    
+    history = CalculationHistory()
+    filepath = tmp_path / 'history.csv'
+    observer = AutoSaveObserver(history, str(filepath), flush_interval=6, max_delay=60)
+    for i in range(10):
+        calc = Calculation('add', i, 1, i + 1)
+        history.add_calculation(calc)
+        observer.update(calc)
+    
+    # Copy the files as they are on disk now, before close() snapshots them,
+    # to stand in for a process killed after its last batch was written
+    crashed = tmp_path / 'crashed'
+    crashed.mkdir()
+    shutil.copy(filepath, crashed / 'history.csv')
+    shutil.copy(tmp_path / 'history.csv.wal', crashed / 'history.csv.wal')
+    observer.close()
+    
+    restarted = AutoSaveObserver(CalculationHistory(), str(crashed / 'history.csv'))
+    restarted.close()
+    loaded = CalculationHistory()
+    loaded.load_from_csv(str(crashed / 'history.csv'))
+    
+    assert (crashed / 'history.csv.wal').read_text() == ''
+    assert [c.operand1 for c in loaded.get_history()] == list(range(10))
+
+
+def test_calculator_keeps_sign_of_zero(calculator):
+    """Test a cached result for 0.0 is not reused for -0.0."""
+    import math
+    
+    assert math.copysign(1, calculator.calculate('multiply', 0.0, 5.0)) == 1
+    assert math.copysign(1, calculator.calculate('multiply', -0.0, 5.0)) == -1
+    assert math.copysign(1, calculator.calculate('multiply', 5.0, -0.0)) == -1
+
+
+def test_recovery_does_not_restore_cleared_calculations(tmp_path, monkeypatch):
+    """Test clear, undo and redo are persisted before later logged adds."""
+    import shutil
+    from app.history import CalculationHistory
+    
+    monkeypatch.setenv('CALCULATOR_HISTORY_DIR', str(tmp_path))
+    calc = Calculator()
+    calc._auto_save_observer.max_delay = 60
+    for i in range(3):
+        calc.calculate('add', i, 0)
+    calc.clear_history()
+    calc.calculate('add', 999, 0)
+    calc.calculate('add', 5, 0)
+    calc.undo()
+    for i in range(7, 11):
+        calc.calculate('add', i, 0)
+    
+    # Copy the files as they are on disk before close() snapshots them
+    crashed = tmp_path / 'crashed'
+    crashed.mkdir()
+    for name in ('calculator_history.csv', 'calculator_history.csv.wal'):
+        shutil.copy(tmp_path / name, crashed / name)
+    calc.close()
+    
+    loaded = CalculationHistory()
+    loaded.load_from_csv(str(crashed / 'calculator_history.csv'))
+    
+    assert [c.result for c in loaded.get_history()] == [999.0, 7.0, 8.0, 9.0, 10.0]
+
+
+def test_clear_removes_auto_saved_snapshot(tmp_path, monkeypatch):
+    """Test clearing history leaves no snapshot to be loaded back."""
+    monkeypatch.setenv('CALCULATOR_HISTORY_DIR', str(tmp_path))
+    monkeypatch.setenv('CALCULATOR_AUTO_SAVE_FLUSH_INTERVAL', '1')
+    calc = Calculator()
+    calc.calculate('add', 1, 2)
+    calc.clear_history()
+    calc.close()
+    
+    assert not (tmp_path / 'calculator_history.csv').exists()
+
+
+def test_calculate_after_close_skips_auto_save(tmp_path, monkeypatch, capsys):
+    """Test a closed calculator keeps calculating without auto-save warnings."""
+    monkeypatch.setenv('CALCULATOR_HISTORY_DIR', str(tmp_path))
+    monkeypatch.setenv('CALCULATOR_AUTO_SAVE_FLUSH_INTERVAL', '1')
+    calc = Calculator()
+    calc.close()
+    
+    for i in range(5):
+        assert calc.calculate('add', i, 1) == i + 1
+    calc.calculate_bulk('add', [1, 2], [3, 4])
+    
+    assert "Auto-save failed" not in capsys.readouterr().out
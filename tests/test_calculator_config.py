@@ -14,7 +14,9 @@ def test_config_default_values():
     assert config.log_dir == 'logs'
     assert config.history_dir == 'history'
     assert config.max_history_size == 100
+    assert config.max_undo_levels == 100
     assert config.auto_save is True
+    assert config.auto_save_flush_interval == 10
     assert config.precision == 2
     assert config.max_input_value == 1e10
     assert config.default_encoding == 'utf-8'
@@ -28,12 +30,39 @@ def test_config_creates_directories():
     assert Path(config.history_dir).exists()
 
 
+def test_config_skips_existing_directories(monkeypatch, tmp_path):
+    """Test existing directories are not created again."""
+    monkeypatch.setenv('CALCULATOR_LOG_DIR', str(tmp_path))
+    monkeypatch.setenv('CALCULATOR_HISTORY_DIR', str(tmp_path))
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("makedirs called for an existing directory")
+    
+    monkeypatch.setattr('os.makedirs', fail)
+    CalculatorConfig()
+
+
+def test_config_recreates_removed_directory(monkeypatch, tmp_path):
+    """Test a directory removed after first use is created again."""
+    log_dir = tmp_path / 'removed_logs'
+    monkeypatch.setenv('CALCULATOR_LOG_DIR', str(log_dir))
+    monkeypatch.setenv('CALCULATOR_HISTORY_DIR', str(tmp_path / 'removed_history'))
+    
+    CalculatorConfig()
+    log_dir.rmdir()
+    CalculatorConfig()
+    
+    assert log_dir.exists()
+
+
 def test_config_from_env(monkeypatch):
     """Test configuration loads from environment variables."""
     monkeypatch.setenv('CALCULATOR_LOG_DIR', 'custom_logs')
     monkeypatch.setenv('CALCULATOR_HISTORY_DIR', 'custom_history')
     monkeypatch.setenv('CALCULATOR_MAX_HISTORY_SIZE', '50')
+    monkeypatch.setenv('CALCULATOR_MAX_UNDO_LEVELS', '20')
     monkeypatch.setenv('CALCULATOR_AUTO_SAVE', 'false')
+    monkeypatch.setenv('CALCULATOR_AUTO_SAVE_FLUSH_INTERVAL', '5')
     monkeypatch.setenv('CALCULATOR_PRECISION', '4')
     monkeypatch.setenv('CALCULATOR_MAX_INPUT_VALUE', '999999')
     monkeypatch.setenv('CALCULATOR_DEFAULT_ENCODING', 'ascii')
@@ -43,7 +72,9 @@ def test_config_from_env(monkeypatch):
     assert config.log_dir == 'custom_logs'
     assert config.history_dir == 'custom_history'
     assert config.max_history_size == 50
+    assert config.max_undo_levels == 20
     assert config.auto_save is False
+    assert config.auto_save_flush_interval == 5
     assert config.precision == 4
     assert config.max_input_value == 999999
     assert config.default_encoding == 'ascii'
@@ -73,6 +104,15 @@ def test_config_invalid_int(monkeypatch):
         CalculatorConfig()
 
 
+@pytest.mark.parametrize("key", ['CALCULATOR_MAX_HISTORY_SIZE', 'CALCULATOR_MAX_UNDO_LEVELS'])
+def test_config_negative_size(monkeypatch, key):
+    """Test negative history and undo limits raise error."""
+    monkeypatch.setenv(key, '-1')
+    
+    with pytest.raises(ConfigurationError, match="Invalid non-negative integer value"):
+        CalculatorConfig()
+
+
 def test_config_invalid_float(monkeypatch):
     """Test invalid float value raises error."""
     monkeypatch.setenv('CALCULATOR_MAX_INPUT_VALUE', 'not_a_number')
@@ -1,8 +1,11 @@
 """Tests for memento pattern implementation."""
 
 import pytest
+from collections import deque
 from app.calculation import Calculation
-from app.calculator_memento import CalculatorMemento, HistoryCaretaker
+from app.calculator_memento import (
+    AddBatchCommand, AddCalcCommand, CalculatorMemento, ClearCommand, HistoryCaretaker
+)
 
 
 def test_memento_stores_state():
@@ -33,103 +36,143 @@ def test_memento_returns_copy():
     assert len(memento.get_state()) == 1
 
 
-def test_caretaker_save_state():
-    """Test caretaker saves state."""
-    caretaker = HistoryCaretaker()
+def test_memento_state_is_shared_snapshot():
+    """Test memento state is an immutable snapshot returned without copying."""
     history = [Calculation('add', 1, 2, 3)]
-    
     memento = CalculatorMemento(history)
-    caretaker.save_state(memento)
+    history.append(Calculation('multiply', 2, 3, 6))
     
-    assert caretaker.can_undo() is False  # Need at least 2 states
+    assert isinstance(memento.state, tuple)
+    assert memento.state is memento.state
+    assert len(memento.state) == 1
 
 
-def test_caretaker_undo():
-    """Test caretaker undo functionality."""
-    caretaker = HistoryCaretaker()
+def test_add_command_undo_redo():
+    """Test add command removes and re-appends its calculation."""
+    calc = Calculation('add', 1, 2, 3)
+    history = deque([calc])
+    command = AddCalcCommand(calc)
     
-    # Save initial state (empty)
-    history1 = []
-    caretaker.save_state(CalculatorMemento(history1))
+    command.undo(history)
+    assert list(history) == []
     
-    # Save second state
-    history2 = [Calculation('add', 1, 2, 3)]
-    caretaker.save_state(CalculatorMemento(history2))
+    command.redo(history)
+    assert list(history) == [calc]
+
+
+def test_add_command_restores_evicted():
+    """Test add command restores the entry it evicted."""
+    evicted = Calculation('add', 1, 2, 3)
+    kept = Calculation('subtract', 5, 3, 2)
+    calc = Calculation('multiply', 2, 3, 6)
+    history = deque([kept, calc], maxlen=2)
+    command = AddCalcCommand(calc, evicted)
     
-    # Save third state
-    history3 = [
-        Calculation('add', 1, 2, 3),
-        Calculation('multiply', 4, 5, 20)
-    ]
-    caretaker.save_state(CalculatorMemento(history3))
+    command.undo(history)
+    assert list(history) == [evicted, kept]
+    
+    command.redo(history)
+    assert list(history) == [kept, calc]
+
+
+def test_add_batch_command_undo_redo():
+    """Test batch command removes its calculations and restores evicted ones."""
+    evicted = Calculation('add', 1, 2, 3)
+    kept = Calculation('subtract', 5, 3, 2)
+    batch = (Calculation('multiply', 2, 3, 6), Calculation('divide', 8, 2, 4))
+    history = deque([kept, *batch], maxlen=3)
+    command = AddBatchCommand(batch, (evicted,))
+    
+    command.undo(history)
+    assert list(history) == [evicted, kept]
+    
+    command.redo(history)
+    assert list(history) == [kept, *batch]
+
+
+def test_clear_command_undo_redo():
+    """Test clear command restores and re-clears its snapshot."""
+    calcs = [Calculation('add', 1, 2, 3), Calculation('multiply', 4, 5, 20)]
+    command = ClearCommand(CalculatorMemento(calcs))
+    history = deque()
+    
+    command.undo(history)
+    assert list(history) == calcs
+    
+    command.redo(history)
+    assert list(history) == []
+
+
+def test_caretaker_save_command():
+    """Test caretaker saves command."""
+    caretaker = HistoryCaretaker()
+    caretaker.save_command(AddCalcCommand(Calculation('add', 1, 2, 3)))
     
-    # Now we can undo
     assert caretaker.can_undo() is True
-    memento = caretaker.undo()
-    assert memento is not None
-    restored = memento.get_state()
-    assert len(restored) == 1
+    assert caretaker.can_redo() is False
+
+
+def test_caretaker_undo():
+    """Test caretaker undo functionality."""
+    caretaker = HistoryCaretaker()
+    first = AddCalcCommand(Calculation('add', 1, 2, 3))
+    second = AddCalcCommand(Calculation('multiply', 4, 5, 20))
+    caretaker.save_command(first)
+    caretaker.save_command(second)
+    
+    assert caretaker.undo() is second
+    assert caretaker.undo() is first
+    assert caretaker.can_undo() is False
 
 
 def test_caretaker_redo():
     """Test caretaker redo functionality."""
     caretaker = HistoryCaretaker()
+    first = AddCalcCommand(Calculation('add', 1, 2, 3))
+    second = AddCalcCommand(Calculation('multiply', 4, 5, 20))
+    caretaker.save_command(first)
+    caretaker.save_command(second)
     
-    # Save states
-    caretaker.save_state(CalculatorMemento([]))
-    caretaker.save_state(CalculatorMemento([Calculation('add', 1, 2, 3)]))
-    caretaker.save_state(CalculatorMemento([
-        Calculation('add', 1, 2, 3),
-        Calculation('multiply', 4, 5, 20)
-    ]))
-    
-    # Undo
+    caretaker.undo()
     caretaker.undo()
     
-    # Now we can redo
     assert caretaker.can_redo() is True
-    memento = caretaker.redo()
-    assert memento is not None
-    restored = memento.get_state()
-    assert len(restored) == 2
+    assert caretaker.redo() is first
+    assert caretaker.redo() is second
+    assert caretaker.can_redo() is False
 
 
 def test_caretaker_save_clears_redo():
-    """Test that new state clears redo stack."""
+    """Test that new command clears redo stack."""
     caretaker = HistoryCaretaker()
-    
-    # Save states and undo
-    caretaker.save_state(CalculatorMemento([]))
-    caretaker.save_state(CalculatorMemento([Calculation('add', 1, 2, 3)]))
-    caretaker.save_state(CalculatorMemento([
-        Calculation('add', 1, 2, 3),
-        Calculation('multiply', 4, 5, 20)
-    ]))
+    caretaker.save_command(AddCalcCommand(Calculation('add', 1, 2, 3)))
     caretaker.undo()
     
     assert caretaker.can_redo() is True
     
-    # Save new state - should clear redo
-    caretaker.save_state(CalculatorMemento([
-        Calculation('add', 1, 2, 3),
-        Calculation('divide', 10, 2, 5)
-    ]))
+    caretaker.save_command(AddCalcCommand(Calculation('divide', 10, 2, 5)))
     
     assert caretaker.can_redo() is False
 
 
-def test_caretaker_cannot_undo_empty():
-    """Test cannot undo with empty stack."""
+def test_caretaker_clear_redo():
+    """Test clear_redo drops redoable commands but keeps undoable ones."""
     caretaker = HistoryCaretaker()
-    assert caretaker.can_undo() is False
-    assert caretaker.undo() is None
+    caretaker.save_command(AddCalcCommand(Calculation('add', 1, 2, 3)))
+    caretaker.save_command(AddCalcCommand(Calculation('divide', 10, 2, 5)))
+    caretaker.undo()
+    
+    caretaker.clear_redo()
+    
+    assert caretaker.can_redo() is False
+    assert caretaker.can_undo() is True
 
 
-def test_caretaker_cannot_undo_single_state():
-    """Test cannot undo with only one state."""
+def test_caretaker_cannot_undo_empty():
+    """Test cannot undo with empty stack."""
     caretaker = HistoryCaretaker()
-    caretaker.save_state(CalculatorMemento([]))
     assert caretaker.can_undo() is False
+    assert caretaker.undo() is None
 
 
 def test_caretaker_cannot_redo_empty():
@@ -139,67 +182,28 @@ def test_caretaker_cannot_redo_empty():
     assert caretaker.redo() is None
 
 
-def test_caretaker_clear():
-    """Test clearing caretaker stacks."""
-    caretaker = HistoryCaretaker()
-    
-    caretaker.save_state(CalculatorMemento([]))
-    caretaker.save_state(CalculatorMemento([Calculation('add', 1, 2, 3)]))
-    caretaker.save_state(CalculatorMemento([
-        Calculation('add', 1, 2, 3),
-        Calculation('multiply', 4, 5, 20)
-    ]))
-    
-    caretaker.clear()
+def test_caretaker_max_undo_levels():
+    """Test caretaker drops the oldest command past its undo limit."""
+    caretaker = HistoryCaretaker(max_undo_levels=2)
+    first = AddCalcCommand(Calculation('add', 1, 2, 3))
+    second = AddCalcCommand(Calculation('multiply', 4, 5, 20))
+    third = AddCalcCommand(Calculation('divide', 10, 2, 5))
+    for command in (first, second, third):
+        caretaker.save_command(command)
     
+    assert caretaker.undo() is third
+    assert caretaker.undo() is second
     assert caretaker.can_undo() is False
-    assert caretaker.can_redo() is False
-
-
-def test_caretaker_multiple_undos():
-    """Test multiple undo operations."""
-    caretaker = HistoryCaretaker()
-    
-    # Save multiple states
-    caretaker.save_state(CalculatorMemento([]))
-    caretaker.save_state(CalculatorMemento([Calculation('add', 1, 2, 3)]))
-    caretaker.save_state(CalculatorMemento([
-        Calculation('add', 1, 2, 3),
-        Calculation('multiply', 4, 5, 20)
-    ]))
-    caretaker.save_state(CalculatorMemento([
-        Calculation('add', 1, 2, 3),
-        Calculation('multiply', 4, 5, 20),
-        Calculation('divide', 10, 2, 5)
-    ]))
-    
-    # Undo twice
-    memento1 = caretaker.undo()
-    assert len(memento1.get_state()) == 2
-    
-    memento2 = caretaker.undo()
-    assert len(memento2.get_state()) == 1
 
 
-def test_caretaker_multiple_redos():
-    """Test multiple redo operations."""
+def test_caretaker_clear():
+    """Test clearing caretaker stacks."""
     caretaker = HistoryCaretaker()
-    
-    # Save multiple states
-    caretaker.save_state(CalculatorMemento([]))
-    caretaker.save_state(CalculatorMemento([Calculation('add', 1, 2, 3)]))
-    caretaker.save_state(CalculatorMemento([
-        Calculation('add', 1, 2, 3),
-        Calculation('multiply', 4, 5, 20)
-    ]))
-    
-    # Undo twice
-    caretaker.undo()
+    caretaker.save_command(AddCalcCommand(Calculation('add', 1, 2, 3)))
+    caretaker.save_command(AddCalcCommand(Calculation('multiply', 4, 5, 20)))
     caretaker.undo()
     
-    # Redo twice
-    memento1 = caretaker.redo()
-    assert len(memento1.get_state()) == 1
+    caretaker.clear()
     
-    memento2 = caretaker.redo()
-    assert len(memento2.get_state()) == 2
+    assert caretaker.can_undo() is False
+    assert caretaker.can_redo() is False
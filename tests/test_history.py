@@ -2,6 +2,7 @@
 
 import pytest
 import tempfile
+from datetime import datetime
 from pathlib import Path
 from app.history import CalculationHistory
 from app.calculation import Calculation
@@ -50,6 +51,18 @@ def test_max_size_enforcement():
     assert len(history) == 3
     hist = history.get_history()
     assert hist[0].operation == 'subtract'
+    assert history.get_last_calculation().operation == 'divide'
+
+
+def test_max_size_keeps_storage_bounded():
+    """Test storage never grows past max size under sustained appends."""
+    history = CalculationHistory(max_size=5)
+    
+    for i in range(1000):
+        history.add_calculation(Calculation('add', i, 1, i + 1))
+    
+    assert len(history) == 5
+    assert [calc.operand1 for calc in history.get_history()] == [995, 996, 997, 998, 999]
 
 
 def test_clear_history():
@@ -95,6 +108,89 @@ def test_redo():
     assert len(history) == 2
 
 
+def test_undo_restores_evicted_calculation():
+    """Test undo brings back a calculation evicted by max size."""
+    history = CalculationHistory(max_size=2)
+    history.add_calculation(Calculation('add', 1, 2, 3))
+    history.add_calculation(Calculation('subtract', 5, 3, 2))
+    history.add_calculation(Calculation('multiply', 2, 3, 6))
+    
+    assert history.undo() is True
+    assert [c.operation for c in history.get_history()] == ['add', 'subtract']
+    
+    assert history.redo() is True
+    assert [c.operation for c in history.get_history()] == ['subtract', 'multiply']
+
+
+def test_undo_clear_history():
+    """Test clearing history can be undone."""
+    history = CalculationHistory()
+    history.add_calculation(Calculation('add', 1, 2, 3))
+    history.add_calculation(Calculation('multiply', 4, 5, 20))
+    history.clear_history()
+    
+    assert history.undo() is True
+    assert len(history) == 2
+    
+    assert history.redo() is True
+    assert len(history) == 0
+
+
+def test_clear_empty_history_discards_redo():
+    """Test clearing an empty history stops an undone add being redone."""
+    history = CalculationHistory()
+    history.add_calculation(Calculation('add', 1, 2, 3))
+    history.undo()
+    history.clear_history()
+    
+    assert history.redo() is False
+    assert len(history) == 0
+
+
+def test_zero_max_size_history():
+    """Test a zero-capacity history keeps nothing and records no undo step."""
+    history = CalculationHistory(max_size=0)
+    history.add_calculation(Calculation('add', 1, 2, 3))
+    history.add_calculations_bulk([Calculation('multiply', 4, 5, 20)])
+    
+    assert len(history) == 0
+    assert history.get_last_calculation() is None
+    assert history.undo() is False
+
+
+def test_add_calculations_bulk():
+    """Test bulk add appends calculations as one undoable step."""
+    history = CalculationHistory()
+    history.add_calculation(Calculation('add', 1, 2, 3))
+    history.add_calculations_bulk([
+        Calculation('multiply', 4, 5, 20),
+        Calculation('divide', 10, 2, 5),
+    ])
+    
+    assert len(history) == 3
+    
+    assert history.undo() is True
+    assert [c.operation for c in history.get_history()] == ['add']
+    
+    assert history.redo() is True
+    assert len(history) == 3
+
+
+def test_add_calculations_bulk_enforces_max_size():
+    """Test bulk add trims to max size and undo restores evicted entries."""
+    history = CalculationHistory(max_size=3)
+    history.add_calculation(Calculation('add', 1, 2, 3))
+    history.add_calculation(Calculation('subtract', 5, 3, 2))
+    history.add_calculations_bulk([
+        Calculation('multiply', operand, 2, operand * 2) for operand in range(4)
+    ])
+    
+    assert [c.operand1 for c in history.get_history()] == [1, 2, 3]
+    
+    history.undo()
+    assert [c.operation for c in history.get_history()] == ['add', 'subtract']
+
+
 def test_redo_without_undo():
     """Test redo without undo."""
     history = CalculationHistory()
@@ -174,9 +270,108 @@ def test_load_from_csv():
         Path(filepath).unlink()
 
 
+def test_load_from_csv_preserves_values():
+    """Test loading history restores operands, results and timestamps."""
+    history = CalculationHistory()
+    original = Calculation('divide', 10, 4, 2.5)
+    history.add_calculation(original)
+    
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+        filepath = f.name
+    
+    try:
+        history.save_to_csv(filepath)
+        
+        new_history = CalculationHistory()
+        new_history.load_from_csv(filepath)
+        
+        loaded = new_history.get_last_calculation()
+        assert loaded.operation == 'divide'
+        assert loaded.operand1 == 10.0
+        assert loaded.operand2 == 4.0
+        assert loaded.result == 2.5
+        assert loaded.timestamp == original.timestamp
+    finally:
+        Path(filepath).unlink()
+
+
+def test_load_from_csv_enforces_max_size(tmp_path):
+    """Test loading keeps only the newest max_size calculations."""
+    history = CalculationHistory()
+    for operand in range(5):
+        history.add_calculation(Calculation('add', operand, 1, operand + 1))
+    filepath = tmp_path / 'history.csv'
+    history.save_to_csv(str(filepath))
+    
+    new_history = CalculationHistory(max_size=2)
+    new_history.load_from_csv(str(filepath))
+    
+    assert [c.operand1 for c in new_history.get_history()] == [3.0, 4.0]
+
+
 def test_load_nonexistent_file():
     """Test loading from nonexistent file raises error."""
     history = CalculationHistory()
     
     with pytest.raises(HistoryError, match="History file not found"):
         history.load_from_csv("nonexistent.csv")
+
+
+def test_load_replays_log_after_crash(tmp_path):
+    """Test loading replays calculations logged after the last snapshot."""
+    filepath = tmp_path / 'history.csv'
+    history = CalculationHistory()
+    history.add_calculation(Calculation('add', 1, 2, 3, epoch=1_000_000.0))
+    history.save_to_csv(str(filepath))
+    
+    # A crashed run leaves its post-snapshot calculations only in the log;
+    # the first line repeats the snapshot and the last was torn mid-write
+    stamp = [datetime.fromtimestamp(1_000_000.0 + i).isoformat() for i in range(3)]
+    (tmp_path / 'history.csv.wal').write_text(
+        f"add,1,2,3,{stamp[0]}\n"
+        f"multiply,4,5,20,{stamp[1]}\n"
+        f"divide,9,3,3.0,{stamp[2]}\n"
+        "subtract,7\n"
+    )
+    
+    loaded = CalculationHistory()
+    loaded.load_from_csv(str(filepath))
+    
+    assert [c.operation for c in loaded.get_history()] == ['add', 'multiply', 'divide']
+    assert loaded.get_last_calculation().result == 3.0
+
+
+def test_load_replays_log_without_snapshot(tmp_path):
+    """Test loading works when a crash happened before the first snapshot."""
+    filepath = tmp_path / 'history.csv'
+    (tmp_path / 'history.csv.wal').write_text("add,1,2,3,2026-01-01T00:00:00\n")
+    
+    history = CalculationHistory()
+    history.load_from_csv(str(filepath))
+    
+    assert len(history) == 1
+    assert history.get_last_calculation().operand2 == 2
+
+
+def test_load_skips_log_lines_with_torn_timestamp(tmp_path):
+    """Test unreadable or unterminated log lines are dropped, not fatal."""
+    filepath = tmp_path / 'history.csv'
+    (tmp_path / 'history.csv.wal').write_text(
+        "add,1,2,3,2026-10-15T15:18:20\n"
+        "multiply,4,5,20,2026-10-15T15:18:21.\n"
+        "subtract,7,2,5,2026-10-1"
+    )
+    
+    history = CalculationHistory()
+    history.load_from_csv(str(filepath))
+    
+    assert [c.operation for c in history.get_history()] == ['add']
+
+
+def test_load_ignores_empty_log(tmp_path):
+    """Test an empty log alone does not count as saved history."""
+    filepath = tmp_path / 'history.csv'
+    (tmp_path / 'history.csv.wal').write_text('')
+    
+    with pytest.raises(HistoryError, match="not found"):
+        CalculationHistory().load_from_csv(str(filepath))
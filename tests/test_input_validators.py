@@ -1,10 +1,16 @@
 """Tests for input validators."""
 
+import re
 import pytest
 from app.input_validators import InputValidator
 from app.exceptions import ValidationError
 
 
+# Expected error messages, compiled once for pytest.raises(match=...)
+INVALID_NUMBER = re.compile("Invalid number")
+EXCEEDS_MAXIMUM = re.compile("exceeds maximum")
+
+
 def test_validate_number_valid():
     """Test validating valid numbers."""
     assert InputValidator.validate_number("42") == 42.0
@@ -14,10 +20,10 @@ def test_validate_number_valid():
 
 def test_validate_number_invalid():
     """Test validating invalid numbers."""
-    with pytest.raises(ValidationError, match="Invalid number"):
+    with pytest.raises(ValidationError, match=INVALID_NUMBER):
         InputValidator.validate_number("abc")
     
-    with pytest.raises(ValidationError, match="Invalid number"):
+    with pytest.raises(ValidationError, match=INVALID_NUMBER):
         InputValidator.validate_number("12.34.56")
 
 
@@ -25,7 +31,7 @@ def test_validate_number_with_max_value():
     """Test validation with max value constraint."""
     assert InputValidator.validate_number("100", max_value=1000) == 100.0
     
-    with pytest.raises(ValidationError, match="exceeds maximum"):
+    with pytest.raises(ValidationError, match=EXCEEDS_MAXIMUM):
         InputValidator.validate_number("2000", max_value=1000)
 
 
@@ -33,7 +39,7 @@ def test_validate_number_negative_with_max():
     """Test negative numbers with max value."""
     assert InputValidator.validate_number("-100", max_value=1000) == -100.0
     
-    with pytest.raises(ValidationError, match="exceeds maximum"):
+    with pytest.raises(ValidationError, match=EXCEEDS_MAXIMUM):
         InputValidator.validate_number("-2000", max_value=1000)
 
 
@@ -67,3 +73,73 @@ def test_validate_operands_exceeds_max():
     """Test validation fails when operand exceeds max."""
     with pytest.raises(ValidationError):
         InputValidator.validate_operands("10", "2000", max_value=1000)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("42", 42.0),
+    ("3.14", 3.14),
+    ("-10", -10.0),
+    ("+.5", 0.5),
+    ("1e3", 1000.0),
+    ("-2.5E-2", -0.025),
+])
+def test_validate_number_accepts(value, expected):
+    """Test plain decimal and scientific notation are accepted."""
+    assert InputValidator.validate_number(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "abc", "12.34.56", "", "   ", "1_000", "inf", "-Infinity", "nan", "1e400", None,
+])
+def test_validate_number_rejects(value):
+    """Test values that are not finite plain numbers are rejected."""
+    with pytest.raises(ValidationError, match=INVALID_NUMBER):
+        InputValidator.validate_number(value)
+
+
+def test_validate_number_allows_surrounding_whitespace():
+    """Test surrounding whitespace is ignored."""
+    assert InputValidator.validate_number(" 1.5e3 ") == 1500.0
+
+
+def test_validate_number_unchecked():
+    """Test unchecked validation converts and checks range."""
+    assert InputValidator.validate_number_unchecked("42") == 42.0
+    
+    with pytest.raises(ValidationError, match=EXCEEDS_MAXIMUM):
+        InputValidator.validate_number_unchecked(2000, max_value=1000)
+
+
+def test_validate_numbers():
+    """Test batch validation returns a float array."""
+    numbers = InputValidator.validate_numbers(["1", "2.5", "-3"], max_value=10)
+    
+    assert numbers.dtype == 'float64'
+    assert numbers.tolist() == [1.0, 2.5, -3.0]
+
+
+def test_validate_numbers_invalid():
+    """Test batch validation rejects invalid values."""
+    with pytest.raises(ValidationError, match=INVALID_NUMBER):
+        InputValidator.validate_numbers(["1", "abc"])
+
+
+@pytest.mark.parametrize("value", ["nan", "inf", "-Infinity", "1e400", "1_000"])
+def test_validate_numbers_rejects_non_plain_numbers(value):
+    """Test batch validation rejects what validate_number rejects."""
+    with pytest.raises(ValidationError, match=INVALID_NUMBER):
+        InputValidator.validate_numbers(["1", value], max_value=1000)
+
+
+def test_validate_numbers_rejects_nan_array():
+    """Test batch validation rejects NaN in an already-numeric array."""
+    import numpy as np
+    
+    with pytest.raises(ValidationError, match=INVALID_NUMBER):
+        InputValidator.validate_numbers(np.array([1.0, np.nan]))
+
+
+def test_validate_numbers_exceeds_max():
+    """Test batch validation rejects values over the maximum."""
+    with pytest.raises(ValidationError, match=EXCEEDS_MAXIMUM):
+        InputValidator.validate_numbers(["1", "-2000"], max_value=1000)
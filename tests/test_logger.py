@@ -1,11 +1,58 @@
 """Tests for logger module."""
 
+import io
 import pytest
 import logging
-from pathlib import Path
-import tempfile
+import uuid
 from app.logger import Logger
 
+# The logger is a process-wide singleton, so keep these tests on one worker
+pytestmark = pytest.mark.xdist_group("logger_singleton")
+
+
+@pytest.fixture(scope="session")
+def logdir_root(tmp_path_factory):
+    """Temporary root shared by all logger tests, removed once per session."""
+    return tmp_path_factory.mktemp("logs")
+
+
+@pytest.fixture
+def workdir(logdir_root):
+    """Per-test directory under the shared logger test root."""
+    path = logdir_root / uuid.uuid4().hex
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def console(monkeypatch):
+    """In-memory stream that console handlers built during a test write to."""
+    stream = io.StringIO()
+    build = Logger._build.__func__
+    
+    def build_with_memory_console(cls, log_dir, log_file):
+        build(cls, log_dir, log_file)
+        for handler in cls._logger.handlers:
+            if type(handler) is logging.StreamHandler:
+                handler.setStream(stream)
+    
+    monkeypatch.setattr(Logger, '_build', classmethod(build_with_memory_console))
+    return stream
+
+
+@pytest.fixture(autouse=True)
+def reset_logger(workdir, console, monkeypatch):
+    """Give each test a fresh logger whose default log directory is temporary."""
+    monkeypatch.chdir(workdir)
+    Logger._logger = None
+    Logger._target = None
+    logging.getLogger('calculator').handlers.clear()
+    yield
+    Logger._stop_listener()
+    Logger._logger = None
+    Logger._target = None
+    logging.getLogger('calculator').handlers.clear()
+
 
 def test_get_logger():
     """Test getting logger instance."""
@@ -15,54 +62,114 @@ def test_get_logger():
     assert logger.name == 'calculator'
 
 
-def test_logger_singleton():
-    """Test logger returns same instance."""
-    logger1 = Logger.get_logger()
-    logger2 = Logger.get_logger()
-    assert logger1 is logger2
+def test_logger_creates_log_directory(workdir):
+    """Test logger creates log directory."""
+    log_dir = workdir / 'test_logs'
+    logger = Logger.get_logger(log_dir=str(log_dir), log_file='test.log')
+    
+    # Directory should exist; the file is only opened on first record
+    assert log_dir.exists()
+    assert not (log_dir / 'test.log').exists()
+    
+    # Logger should enqueue file records and print console records directly
+    handler_types = [type(h).__name__ for h in logger.handlers]
+    assert handler_types == ['QueueHandler', 'StreamHandler']
+    
+    # Listener should have the buffered file handler
+    listener_types = [type(h).__name__ for h in Logger._listener.handlers]
+    assert listener_types == ['MemoryHandler']
+    assert type(Logger._listener.handlers[0].target).__name__ == 'FileHandler'
 
 
-def test_logger_creates_log_directory():
-    """Test logger creates log directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        log_dir = Path(tmpdir) / 'test_logs'
-        
-        # Properly reset the logger singleton
-        Logger._logger = None
-        
-        # Also need to get a fresh logger instance to clear old handlers
-        if logging.getLogger('calculator').handlers:
-            logging.getLogger('calculator').handlers.clear()
-        
-        logger = Logger.get_logger(log_dir=str(log_dir), log_file='test.log')
-        
-        # Directory should exist
-        assert log_dir.exists()
-        
-        # Logger should have handlers
-        assert len(logger.handlers) >= 2
-        
-        # Should have file and stream handlers
-        handler_types = [type(h).__name__ for h in logger.handlers]
-        assert 'FileHandler' in handler_types
-        assert 'StreamHandler' in handler_types
-
-
-def test_logger_has_handlers():
-    """Test logger has file and console handlers."""
-    Logger._logger = None  # Reset singleton
+def test_logger_shape(subtests):
+    """Test one default logger build: singleton, level and handlers."""
     logger = Logger.get_logger()
     
-    assert len(logger.handlers) >= 2
+    with subtests.test("singleton"):
+        assert Logger.get_logger() is logger
     
-    handler_types = [type(h).__name__ for h in logger.handlers]
-    assert 'FileHandler' in handler_types
-    assert 'StreamHandler' in handler_types
+    with subtests.test("level"):
+        assert logger.level == logging.DEBUG
+    
+    with subtests.test("handlers"):
+        assert len(logger.handlers) >= 1
+        assert [type(h).__name__ for h in Logger._listener.handlers] == ['MemoryHandler']
+        assert 'StreamHandler' in [type(h).__name__ for h in logger.handlers]
+
+
+def test_logger_writes_through_listener(workdir):
+    """Test records reach the file handler through the queue listener."""
+    logger = Logger.get_logger(log_dir=str(workdir), log_file='queued.log')
+    logger.info("queued message")
+    Logger.flush()
+    
+    assert "queued message" in (workdir / 'queued.log').read_text()
 
 
-def test_logger_level():
-    """Test logger level is set correctly."""
-    Logger._logger = None  # Reset singleton
+def test_logger_same_target_keeps_listener(workdir):
+    """Test repeated calls with the same log file do not rebuild handlers."""
+    Logger.get_logger(log_dir=str(workdir), log_file='same.log')
+    listener = Logger._listener
+    
+    Logger.get_logger(log_dir=str(workdir), log_file='same.log')
+    
+    assert Logger._listener is listener
+
+
+def test_logger_rebinds_for_new_log_dir(workdir):
+    """Test requesting a different log directory rebinds the handlers."""
+    first = Logger.get_logger(log_dir=str(workdir / 'a'), log_file='a.log')
+    second = Logger.get_logger(log_dir=str(workdir / 'b'), log_file='b.log')
+    
+    assert first is second
+    assert len(second.handlers) == 2
+    
+    second.info("rebound message")
+    Logger.flush()
+    
+    assert "rebound message" in (workdir / 'b' / 'b.log').read_text()
+
+
+def test_logger_buffers_file_records_until_flush(workdir):
+    """Test file records are batched until the buffer is flushed."""
+    logger = Logger.get_logger(log_dir=str(workdir), log_file='buffered.log')
+    log_file = workdir / 'buffered.log'
+    
+    logger.info("buffered message")
+    Logger._listener.queue.join()
+    assert not log_file.exists()
+    
+    Logger.flush()
+    assert "buffered message" in log_file.read_text()
+
+
+def test_logger_error_flushes_file_buffer(workdir):
+    """Test an error record flushes buffered file records immediately."""
+    logger = Logger.get_logger(log_dir=str(workdir), log_file='errors.log')
+    
+    logger.info("before error")
+    logger.error("error message")
+    Logger._listener.queue.join()
+    
+    text = (workdir / 'errors.log').read_text()
+    assert "before error" in text
+    assert "error message" in text
+
+
+def test_logger_console_shows_info_and_above(console):
+    """Test the console handler skips debug records."""
     logger = Logger.get_logger()
     
-    assert logger.level == logging.DEBUG
+    logger.debug("debug message")
+    logger.info("info message")
+    Logger.flush()
+    
+    assert "info message" in console.getvalue()
+    assert "debug message" not in console.getvalue()
+
+
+
+def test_logger_console_prints_synchronously(console):
+    """Test console records are written before the logging call returns."""
+    Logger.get_logger().info("immediate message")
+    assert "immediate message" in console.getvalue()
@@ -1,181 +1,192 @@
 """Tests for operations and factory."""
 
+import re
 import pytest
 from app.operations import (
     AddOperation, SubtractOperation, MultiplyOperation, DivideOperation,
     PowerOperation, RootOperation, ModulusOperation, IntDivideOperation,
-    PercentageOperation, AbsDifferenceOperation, OperationFactory
+    PercentageOperation, AbsDifferenceOperation, OperationFactory,
+    execute_vectorized
 )
 from app.exceptions import OperationError
+from tests.helpers import DIVIDE_BY_ZERO, UNKNOWN_OPERATION, assert_raises
+
+
+# Expected error messages, compiled once and searched by assert_raises
+ZERO_ROOT = re.compile("Cannot calculate 0th root")
+EVEN_ROOT = re.compile("Cannot calculate even root")
+MODULUS_ZERO = re.compile("Cannot perform modulus with zero")
+PERCENT_ZERO = re.compile("Cannot calculate percentage with zero")
+NON_FINITE = re.compile("non-finite")
+
+
+# Test operations
+@pytest.mark.parametrize("name, a, b, expected", [
+    ('add', 5, 3, 8),
+    ('subtract', 10, 4, 6),
+    ('multiply', 6, 7, 42),
+    ('divide', 15, 3, 5),
+    ('power', 2, 3, 8),
+    ('power', 5, 2, 25),
+    ('power', 2, -1, 0.5),
+    ('root', 27, 3, 3),
+    ('root', 16, 2, 4),
+    ('modulus', 10, 3, 1),
+    ('modulus', 15, 4, 3),
+    ('int_divide', 10, 3, 3),
+    ('int_divide', 15, 4, 3),
+    ('percent', 50, 200, 25),
+    ('percent', 75, 300, 25),
+    ('abs_diff', 10, 3, 7),
+    ('abs_diff', 3, 10, 7),
+    ('abs_diff', -5, 5, 10),
+])
+def test_operation_execute(ops, name, a, b, expected):
+    """Test each operation computes the expected result."""
+    assert ops[name].execute(a, b) == expected
+
+
+@pytest.mark.parametrize("name, a, b, expected", [
+    ('add', 5, 3, 8),
+    ('subtract', 10, 4, 6),
+    ('multiply', 6, 7, 42),
+    ('power', 2, 3, 8),
+    ('modulus', 10, 3, 1),
+    ('int_divide', 10, 3, 3),
+    ('abs_diff', 3, 10, 7),
+])
+def test_operation_preserves_int(ops, name, a, b, expected):
+    """Test integer operands give exact integer results where the math allows."""
+    result = ops[name].execute(a, b)
+    assert type(result) is int
+    assert result == expected
+
+
+@pytest.mark.parametrize("name, symbol", [
+    ('add', "+"),
+    ('subtract', "-"),
+    ('multiply', "*"),
+    ('divide', "/"),
+    ('power', "^"),
+    ('root', "√"),
+    ('modulus', "%"),
+    ('int_divide', "//"),
+    ('percent', "%of"),
+    ('abs_diff', "abs_diff"),
+])
+def test_operation_symbol(ops, name, symbol):
+    """Test each operation reports its symbol."""
+    assert type(ops[name]).symbol == symbol
+    assert ops[name].get_symbol() == symbol
+
+
+@pytest.mark.parametrize("name, a, b, match", [
+    ('divide', 10, 0, DIVIDE_BY_ZERO),
+    ('root', 10, 0, ZERO_ROOT),
+    ('root', -16, 2, EVEN_ROOT),
+    ('modulus', 10, 0, MODULUS_ZERO),
+    ('int_divide', 10, 0, DIVIDE_BY_ZERO),
+    ('percent', 10, 0, PERCENT_ZERO),
+])
+def test_operation_invalid_operands(ops, name, a, b, match):
+    """Test invalid operands raise OperationError."""
+    assert_raises(OperationError, match, ops[name].execute, a, b)
 
 
-# Test basic operations
-def test_add_operation():
-    """Test addition operation."""
-    op = AddOperation()
-    assert op.execute(5, 3) == 8
-    assert op.get_symbol() == "+"
-
-
-def test_subtract_operation():
-    """Test subtraction operation."""
-    op = SubtractOperation()
-    assert op.execute(10, 4) == 6
-    assert op.get_symbol() == "-"
-
-
-def test_multiply_operation():
-    """Test multiplication operation."""
-    op = MultiplyOperation()
-    assert op.execute(6, 7) == 42
-    assert op.get_symbol() == "*"
-
-
-def test_divide_operation():
-    """Test division operation."""
-    op = DivideOperation()
-    assert op.execute(15, 3) == 5
-    assert op.get_symbol() == "/"
-
-
-def test_divide_by_zero():
-    """Test division by zero raises error."""
-    op = DivideOperation()
-    with pytest.raises(OperationError, match="Cannot divide by zero"):
-        op.execute(10, 0)
-
-
-# Test advanced operations
-def test_power_operation():
-    """Test power operation."""
-    op = PowerOperation()
-    assert op.execute(2, 3) == 8
-    assert op.execute(5, 2) == 25
-    assert op.get_symbol() == "^"
-
-
-def test_power_operation_negative_exponent():
-    """Test power with negative exponent."""
-    op = PowerOperation()
-    assert op.execute(2, -1) == 0.5
-
-
-def test_root_operation():
-    """Test root operation."""
-    op = RootOperation()
-    assert op.execute(27, 3) == 3
-    assert op.execute(16, 2) == 4
-    assert op.get_symbol() == "√"
-
-
-def test_root_operation_zero_root():
-    """Test root with zero raises error."""
-    op = RootOperation()
-    with pytest.raises(OperationError, match="Cannot calculate 0th root"):
-        op.execute(10, 0)
+# Test OperationFactory
+@pytest.mark.parametrize("name, op_cls", [
+    ('add', AddOperation),
+    ('subtract', SubtractOperation),
+    ('multiply', MultiplyOperation),
+    ('divide', DivideOperation),
+    ('power', PowerOperation),
+    ('root', RootOperation),
+    ('modulus', ModulusOperation),
+    ('int_divide', IntDivideOperation),
+    ('percent', PercentageOperation),
+    ('abs_diff', AbsDifferenceOperation),
+])
+def test_factory_create_operation(name, op_cls):
+    """Test factory creates each operation."""
+    assert isinstance(OperationFactory.create_operation(name), op_cls)
 
 
-def test_root_operation_even_root_negative():
-    """Test even root of negative number raises error."""
-    op = RootOperation()
-    with pytest.raises(OperationError, match="Cannot calculate even root"):
-        op.execute(-16, 2)
+def test_factory_case_insensitive():
+    """Test factory is case insensitive and returns the shared instance."""
+    op1 = OperationFactory.create_operation('ADD')
+    op2 = OperationFactory.create_operation('Add')
+    op3 = OperationFactory.create_operation('add')
+    
+    assert isinstance(op3, AddOperation)
+    assert op1 is op2 is op3 is OperationFactory.create_operation('add')
 
 
-def test_modulus_operation():
-    """Test modulus operation."""
-    op = ModulusOperation()
-    assert op.execute(10, 3) == 1
-    assert op.execute(15, 4) == 3
-    assert op.get_symbol() == "%"
+def test_factory_mixed_case_returns_shared_instance():
+    """Test that mixed-case names resolve to the canonical instance."""
+    assert OperationFactory.create_operation('Int_Divide') is OperationFactory.create_operation('int_divide')
 
 
-def test_modulus_by_zero():
-    """Test modulus by zero raises error."""
-    op = ModulusOperation()
-    with pytest.raises(OperationError, match="Cannot perform modulus with zero"):
-        op.execute(10, 0)
+def test_factory_memoizes_normalized_names():
+    """Test repeated non-canonical names are resolved from the cache."""
+    OperationFactory._lookup_normalized.cache_clear()
+    
+    for _ in range(3):
+        OperationFactory.create_operation('Multiply')
+    
+    info = OperationFactory._lookup_normalized.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
 
 
-def test_int_divide_operation():
-    """Test integer division operation."""
-    op = IntDivideOperation()
-    assert op.execute(10, 3) == 3
-    assert op.execute(15, 4) == 3
-    assert op.get_symbol() == "//"
+def test_factory_reuses_instances():
+    """Test factory returns the same instance for an operation name."""
+    assert OperationFactory.create_operation('add') is OperationFactory.create_operation('add')
 
 
-def test_int_divide_by_zero():
-    """Test integer division by zero raises error."""
-    op = IntDivideOperation()
-    with pytest.raises(OperationError, match="Cannot divide by zero"):
-        op.execute(10, 0)
+def test_factory_unknown_operation():
+    """Test factory raises error for unknown operation."""
+    assert_raises(OperationError, UNKNOWN_OPERATION, OperationFactory.create_operation, 'invalid')
 
 
-def test_percentage_operation():
-    """Test percentage operation."""
-    op = PercentageOperation()
-    assert op.execute(50, 200) == 25
-    assert op.execute(75, 300) == 25
-    assert op.get_symbol() == "%of"
+def test_factory_get_available_operations():
+    """Test getting available operations."""
+    operations = OperationFactory.get_available_operations()
+    assert 'add' in operations
+    assert 'subtract' in operations
+    assert 'power' in operations
+    assert len(operations) == 10
+    assert OperationFactory.get_available_operations() is operations
 
 
-def test_percentage_zero_denominator():
-    """Test percentage with zero denominator raises error."""
-    op = PercentageOperation()
-    with pytest.raises(OperationError, match="Cannot calculate percentage with zero"):
-        op.execute(10, 0)
+# Test vectorized execution
+def test_execute_vectorized():
+    """Test vectorized execution over arrays."""
+    assert execute_vectorized('add', [1, 2], [3, 4]).tolist() == [4.0, 6.0]
+    assert execute_vectorized('abs_diff', [3, -5], [10, 5]).tolist() == [7.0, 10.0]
+    assert execute_vectorized('int_divide', [10, 15], [3, 4]).tolist() == [3.0, 3.0]
 
 
-def test_abs_difference_operation():
-    """Test absolute difference operation."""
-    op = AbsDifferenceOperation()
-    assert op.execute(10, 3) == 7
-    assert op.execute(3, 10) == 7
-    assert op.execute(-5, 5) == 10
-    assert op.get_symbol() == "abs_diff"
+def test_execute_vectorized_case_insensitive():
+    """Test vectorized execution is case insensitive."""
+    assert execute_vectorized('ADD', [1], [2]).tolist() == [3.0]
 
 
-# Test OperationFactory
-def test_factory_create_add():
-    """Test factory creates add operation."""
-    op = OperationFactory.create_operation('add')
-    assert isinstance(op, AddOperation)
-
-
-def test_factory_create_all_operations():
-    """Test factory can create all operations."""
-    operations = [
-        'add', 'subtract', 'multiply', 'divide', 'power',
-        'root', 'modulus', 'int_divide', 'percent', 'abs_diff'
-    ]
+def test_execute_vectorized_zero_divisor():
+    """Test vectorized execution rejects zero divisors."""
+    assert_raises(OperationError, DIVIDE_BY_ZERO, execute_vectorized, 'divide', [1, 2], [1, 0])
     
-    for op_name in operations:
-        op = OperationFactory.create_operation(op_name)
-        assert op is not None
+    assert_raises(OperationError, MODULUS_ZERO, execute_vectorized, 'modulus', [1], [0])
 
 
-def test_factory_case_insensitive():
-    """Test factory is case insensitive."""
-    op1 = OperationFactory.create_operation('ADD')
-    op2 = OperationFactory.create_operation('Add')
-    op3 = OperationFactory.create_operation('add')
-    
-    assert isinstance(op1, AddOperation)
-    assert isinstance(op2, AddOperation)
-    assert isinstance(op3, AddOperation)
+def test_execute_vectorized_even_root_negative():
+    """Test vectorized root rejects even roots of negative numbers."""
+    assert_raises(OperationError, EVEN_ROOT, execute_vectorized, 'root', [16, -16], [2, 2])
 
 
-def test_factory_unknown_operation():
-    """Test factory raises error for unknown operation."""
-    with pytest.raises(OperationError, match="Unknown operation"):
-        OperationFactory.create_operation('invalid')
+def test_execute_vectorized_non_finite():
+    """Test vectorized execution rejects non-finite results."""
+    assert_raises(OperationError, NON_FINITE, execute_vectorized, 'power', [10], [400])
 
 
-def test_factory_get_available_operations():
-    """Test getting available operations."""
-    operations = OperationFactory.get_available_operations()
-    assert 'add' in operations
-    assert 'subtract' in operations
-    assert 'power' in operations
-    assert len(operations) == 10
+def test_execute_vectorized_unknown_operation():
+    """Test vectorized execution rejects unknown operations."""
+    assert_raises(OperationError, UNKNOWN_OPERATION, execute_vectorized, 'invalid', [1], [2])